@@ -5,12 +5,13 @@ A Python-based git pre-push hook that performs AI-powered code review
 using AWS Bedrock APIs with configurable rules and interactive feedback.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "AI Code Review Team"
 __email__ = "contact@example.com"
 
 # Package-level imports
-from .config.manager import ConfigManager
 from .utils.exceptions import (
     AICodeReviewError,
     ConfigurationError,
@@ -19,6 +20,11 @@ from .utils.exceptions import (
     NetworkError
 )
 
+# Heavier exports are resolved on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "ConfigManager": ".config.manager",
+}
+
 __all__ = [
     "ConfigManager",
     "AICodeReviewError",
@@ -26,4 +32,17 @@ __all__ = [
     "GitError",
     "BedrockError",
     "NetworkError",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,103 @@
+"""
+On-disk cache of Bedrock responses for AI Code Review
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'ai-code-review' / 'bedrock'
+
+
+class ResponseCache:
+    """Content-addressed cache storing one JSON file per response"""
+    
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: int = 3600):
+        """
+        Initialize response cache
+        
+        Args:
+            cache_dir: Directory for cache entries (defaults to ~/.cache/ai-code-review/bedrock)
+            ttl: Entry lifetime in seconds (0 disables expiry)
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self._pruned = False
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry
+        
+        Args:
+            key: Hex digest identifying the entry
+        
+        Returns:
+            Cached data or None if missing, expired or unreadable
+        """
+        path = self.cache_dir / f'{key}.json'
+        
+        try:
+            if self.ttl and time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink()
+                return None
+            
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+    
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Store an entry; failures are logged and ignored
+        
+        Args:
+            key: Hex digest identifying the entry
+            data: JSON-serializable data
+        """
+        path = self.cache_dir / f'{key}.json'
+        tmp_name = None
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if not self._pruned:
+                self._prune()
+            
+            # A private temp file per writer keeps concurrent hooks from clobbering each other
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cache_dir,
+                                             suffix='.tmp', delete=False) as f:
+                tmp_name = f.name
+                json.dump(data, f)
+            os.replace(tmp_name, path)
+        except Exception as e:
+            logger.debug("Failed to write cache entry %s: %s", path, e)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+    
+    def _prune(self) -> None:
+        """Remove expired entries and leftover temp files; runs once per cache instance"""
+        self._pruned = True
+        if not self.ttl:
+            return
+        
+        cutoff = time.time() - self.ttl
+        for path in self.cache_dir.iterdir():
+            if path.suffix not in ('.json', '.tmp'):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
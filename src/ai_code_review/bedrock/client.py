@@ -2,21 +2,116 @@
 AWS Bedrock client for AI Code Review
 """
 
+import hashlib
 import json
-import time
-import boto3
-from typing import Dict, Any, Optional, List
-from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
-from dataclasses import dataclass
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Callable, Iterator, Sequence, Tuple
+from dataclasses import dataclass, asdict, replace
 
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.exceptions import BedrockError, NetworkError
 from ..utils.logging import get_logger, log_performance
+from .cache import ResponseCache
 from .models import ModelManager
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+    
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=None)
+def _get_boto3():
+    """Import boto3 on first use so CLI startup doesn't pay for it"""
+    import boto3
+    return boto3
+
+
+@lru_cache(maxsize=None)
+def _get_session(region: str, profile: Optional[str]):
+    """Get a boto3 session shared by all clients for (region, profile)"""
+    session_kwargs = {'region_name': region}
+    if profile:
+        session_kwargs['profile_name'] = profile
+    return _get_boto3().Session(**session_kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_clients(region: str, profile: Optional[str], timeout: int,
+                 max_pool_connections: int, retry_attempts: int):
+    """Get (runtime, management) Bedrock clients shared for identical settings"""
+    from botocore.config import Config
+    
+    session = _get_session(region, profile)
+    
+    # Keep connections alive and pooled so concurrent reviews don't queue on
+    # the pool; adaptive retries share a throttling token bucket across calls
+    client_config = Config(
+        region_name=region,
+        max_pool_connections=max_pool_connections,
+        retries={'total_max_attempts': retry_attempts + 1, 'mode': 'adaptive'},
+        connect_timeout=timeout,
+        read_timeout=timeout,
+        tcp_keepalive=True
+    )
+    
+    # Create runtime client for model invocation
+    runtime_client = session.client('bedrock-runtime', region_name=region, config=client_config)
+    
+    # Create management client for listing models and other operations
+    management_client = session.client('bedrock', region_name=region, config=client_config)
+    
+    return runtime_client, management_client
+
+
+@lru_cache(maxsize=None)
+def _get_token_encoding():
+    """Get the tiktoken encoding if tiktoken is installed and usable"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception:
+        return None
 
-@dataclass
+
+def _estimate_token_count(text: str) -> int:
+    """Estimate tokens in text for models that don't report usage"""
+    encoding = _get_token_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(text) >> 2  # ~4 chars/token
+
+
+# Bedrock error code -> message prefix for translated ClientErrors
+_ERROR_PREFIXES = {
+    'ThrottlingException': 'Rate limit exceeded',
+    'ValidationException': 'Invalid request',
+    'ModelNotReadyException': 'Model not ready',
+    'ServiceQuotaExceededException': 'Service quota exceeded',
+}
+
+_NO_CREDENTIALS_MESSAGE = (
+    "AWS credentials not found. Please configure AWS credentials using "
+    "AWS CLI, environment variables, or IAM roles."
+)
+
+# (region, profile) pairs whose credentials have already been validated
+_validated_credentials = set()
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BedrockResponse:
     """Response from Bedrock API"""
     content: str
@@ -30,15 +125,18 @@ class BedrockResponse:
 class BedrockClient:
     """AWS Bedrock client with retry logic and error handling"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], perf_config: Optional[Dict[str, Any]] = None):
         """
         Initialize Bedrock client
         
         Args:
             config: Bedrock configuration
+            perf_config: Performance configuration controlling the response cache
+                and worker count (optional)
         """
         self.config = config
         self.model_manager = ModelManager()
+        perf_config = perf_config or {}
         
         # Extract configuration
         self.region = config.get('region', 'us-east-1')
@@ -48,7 +146,52 @@ class BedrockClient:
         self.temperature = config.get('temperature', 0.1)
         self.timeout = config.get('timeout', 30)
         self.retry_attempts = config.get('retry_attempts', 3)
-        self.retry_delay = config.get('retry_delay', 1)
+        
+        # Every review worker needs its own kept-alive connection, so never pool fewer
+        self.max_pool_connections = max(
+            10, config.get('max_pool_connections', 25), perf_config.get('max_workers', 0)
+        )
+        self.stream = config.get('stream', False)
+        
+        # Only deterministic (temperature 0) responses are safe to replay
+        self._response_cache = None
+        if perf_config.get('cache_enabled', False) and self.temperature == 0:
+            self._response_cache = ResponseCache(ttl=perf_config.get('cache_ttl', 3600))
+        
+        # Resolve model metadata once; it is needed on every invocation
+        try:
+            self._model_info = self.model_manager.get_model_info(self.model_id)
+        except ValueError as e:
+            raise BedrockError(str(e))
+        
+        self._input_cost_per_token = self._model_info.input_cost_per_1k / 1000.0
+        self._output_cost_per_token = self._model_info.output_cost_per_1k / 1000.0
+        
+        # Static request fields, merged into every request body
+        request_templates = {
+            'anthropic': {
+                "anthropic_version": "bedrock-2023-05-31",
+                "max_tokens": self.max_tokens,
+                "temperature": self.temperature,
+            },
+            'meta': {
+                "max_gen_len": self.max_tokens,
+                "temperature": self.temperature,
+                "top_p": 0.9,
+            },
+            'cohere': {
+                "max_tokens": self.max_tokens,
+                "temperature": self.temperature,
+                "p": 0.9,
+            },
+            'ai21': {
+                "max_tokens": self.max_tokens,
+                "temperature": self.temperature,
+                "top_p": 0.9,
+            },
+        }
+        self._request_template = request_templates.get(self._model_info.provider, {})
+        self._llama_system_prefix = (None, '')
         
         # Initialize AWS clients
         self._runtime_client = None
@@ -58,52 +201,57 @@ class BedrockClient:
     def _initialize_clients(self) -> None:
         """Initialize AWS Bedrock clients"""
         try:
-            session_kwargs = {'region_name': self.region}
-            if self.profile:
-                session_kwargs['profile_name'] = self.profile
-            
-            session = boto3.Session(**session_kwargs)
-            
-            # Create runtime client for model invocation
-            self._runtime_client = session.client(
-                'bedrock-runtime',
-                region_name=self.region
-            )
-            
-            # Create management client for listing models and other operations
-            self._management_client = session.client(
-                'bedrock',
-                region_name=self.region
+            self._runtime_client, self._management_client = _get_clients(
+                self.region, self.profile, self.timeout,
+                self.max_pool_connections, self.retry_attempts
             )
             
-            # Test credentials
-            self._test_credentials()
-            
-            logger.info(f"Initialized Bedrock clients for region {self.region}")
+            logger.info("Initialized Bedrock clients for region %s", self.region)
             
-        except NoCredentialsError:
-            raise BedrockError(
-                "AWS credentials not found. Please configure AWS credentials using "
-                "AWS CLI, environment variables, or IAM roles."
-            )
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            raise BedrockError(f"Failed to initialize Bedrock client: {error_code}", str(e))
         except Exception as e:
             raise BedrockError(f"Unexpected error initializing Bedrock client: {str(e)}")
     
+    def validate_credentials(self) -> None:
+        """
+        Validate AWS credentials
+        
+        Not called during normal reviews: missing credentials surface from the
+        first model invocation instead. Success is remembered per (region, profile).
+        
+        Raises:
+            BedrockError: If credentials are missing or invalid
+        """
+        from botocore.exceptions import BotoCoreError, NoCredentialsError
+        
+        credentials_key = (self.region, self.profile)
+        if credentials_key in _validated_credentials:
+            return
+        
+        try:
+            self._test_credentials()
+        except NoCredentialsError:
+            raise BedrockError(_NO_CREDENTIALS_MESSAGE)
+        except BotoCoreError as e:
+            raise NetworkError(f"Network error validating AWS credentials: {str(e)}")
+        
+        _validated_credentials.add(credentials_key)
+    
     def _test_credentials(self) -> None:
-        """Test AWS credentials by making a simple API call"""
+        """Test AWS credentials with STS GetCallerIdentity"""
+        from botocore.exceptions import ClientError
+        
         try:
-            # Try to list foundation models to test credentials
-            response = self._management_client.list_foundation_models()
+            # GetCallerIdentity needs no IAM permissions and returns a tiny payload;
+            # missing Bedrock permissions surface from the first invocation instead
+            sts_client = _get_session(self.region, self.profile).client('sts', region_name=self.region)
+            sts_client.get_caller_identity()
             logger.debug("AWS credentials validated successfully")
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            if error_code == 'UnauthorizedOperation':
+            if error_code in ('InvalidClientTokenId', 'SignatureDoesNotMatch', 'ExpiredToken'):
                 raise BedrockError(
-                    "AWS credentials are valid but don't have permission to access Bedrock. "
-                    "Please ensure your AWS user/role has the necessary Bedrock permissions."
+                    "AWS credentials are invalid or expired. Please refresh your AWS credentials.",
+                    error_code
                 )
             else:
                 raise BedrockError(f"AWS credential test failed: {error_code}", str(e))
@@ -111,7 +259,7 @@ class BedrockClient:
     @log_performance
     def invoke_model(self, prompt: str, system_prompt: Optional[str] = None) -> BedrockResponse:
         """
-        Invoke Bedrock model with retry logic
+        Invoke Bedrock model (retried by botocore on transient failures)
         
         Args:
             prompt: User prompt
@@ -120,38 +268,117 @@ class BedrockClient:
         Returns:
             BedrockResponse object
         """
-        logger.debug(f"Invoking model {self.model_id}")
+        logger.debug("Invoking model %s", self.model_id)
         
-        for attempt in range(self.retry_attempts + 1):
-            try:
-                return self._invoke_model_once(prompt, system_prompt)
-            except BedrockError as e:
-                if attempt == self.retry_attempts:
-                    raise
-                
-                logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {self.retry_delay}s...")
-                time.sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = self._cache_key(prompt, system_prompt)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                try:
+                    # Replayed responses cost nothing
+                    response = replace(BedrockResponse(**cached), cost_estimate=0.0)
+                except (KeyError, TypeError):
+                    logger.debug("Ignoring malformed cached response for model %s", self.model_id)
+                else:
+                    logger.debug("Using cached response for model %s", self.model_id)
+                    return response
+        
+        # Backoff and retries are driven by botocore's adaptive retry mode
+        response = self._invoke_model_once(prompt, system_prompt, stream=self.stream)
+        
+        if cache_key is not None:
+            self._response_cache.set(cache_key, asdict(response))
+        
+        return response
+    
+    @property
+    def caches_responses(self) -> bool:
+        """Whether invoke_model replays responses from the on-disk cache"""
+        return self._response_cache is not None
+    
+    def _cache_key(self, prompt: str, system_prompt: Optional[str]) -> str:
+        """Build the response cache key for a request"""
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(f"{prompt}\0{system_prompt or ''}\0{self.model_id}".encode('utf-8'))
+        digest.update(struct.pack('<Id', self.max_tokens, self.temperature))
+        return digest.hexdigest()
+    
+    @log_performance
+    def invoke_model_streaming(self, prompt: str, system_prompt: Optional[str] = None,
+                               on_text: Optional[Callable[[str], None]] = None) -> BedrockResponse:
+        """
+        Invoke Bedrock model, consuming the completion as it is generated
         
-        raise BedrockError("All retry attempts exhausted")
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt (optional)
+            on_text: Callback receiving each text fragment as it arrives (optional)
+            
+        Returns:
+            BedrockResponse object aggregated from the stream
+        """
+        logger.debug("Invoking model %s with response stream", self.model_id)
+        return self._invoke_model_once(prompt, system_prompt, stream=True, on_text=on_text)
+    
+    def invoke_many(self, requests: List[Tuple[str, Optional[str]]],
+                    max_workers: Optional[int] = None) -> List[BedrockResponse]:
+        """
+        Invoke the model concurrently for independent prompts
+        
+        The underlying botocore client is thread-safe, so all workers share it
+        and its connection pool.
+        
+        Args:
+            requests: List of (prompt, system_prompt) pairs
+            max_workers: Maximum concurrent invocations (defaults to the pool size)
+            
+        Returns:
+            List of BedrockResponse objects in the same order as requests
+        """
+        if not requests:
+            return []
+        
+        max_workers = min(max_workers or self.max_pool_connections, len(requests))
+        if max_workers == 1:
+            return [self.invoke_model(prompt, system_prompt) for prompt, system_prompt in requests]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda request: self.invoke_model(*request), requests))
     
-    def _invoke_model_once(self, prompt: str, system_prompt: Optional[str] = None) -> BedrockResponse:
+    def _invoke_model_once(self, prompt: str, system_prompt: Optional[str] = None,
+                           stream: bool = False,
+                           on_text: Optional[Callable[[str], None]] = None) -> BedrockResponse:
         """Single model invocation attempt"""
+        from botocore.exceptions import ClientError, BotoCoreError, NoCredentialsError
+        
         try:
             # Build request based on model type
             request_body = self._build_request_body(prompt, system_prompt)
             
-            logger.debug(f"Sending request to {self.model_id}")
+            logger.debug("Sending request to %s", self.model_id)
+            
+            if stream:
+                return self._collect_stream(request_body, on_text)
             
             # Make API call
             response = self._runtime_client.invoke_model(
                 modelId=self.model_id,
                 contentType='application/json',
                 accept='application/json',
-                body=json.dumps(request_body)
+                body=_json_dumps(request_body)
             )
             
+            # Read and release the connection back to the pool right away
+            body = response['body']
+            try:
+                raw_body = body.read()
+            finally:
+                body.close()
+            
             # Parse response
-            response_body = json.loads(response['body'].read())
+            response_body = self._decode_body(raw_body)
+            del raw_body
             
             return self._parse_response(response_body)
             
@@ -159,51 +386,115 @@ class BedrockClient:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             error_message = e.response.get('Error', {}).get('Message', str(e))
             
-            if error_code == 'ThrottlingException':
-                raise BedrockError(f"Rate limit exceeded: {error_message}", error_code)
-            elif error_code == 'ValidationException':
-                raise BedrockError(f"Invalid request: {error_message}", error_code)
-            elif error_code == 'ModelNotReadyException':
-                raise BedrockError(f"Model not ready: {error_message}", error_code)
-            elif error_code == 'ServiceQuotaExceededException':
-                raise BedrockError(f"Service quota exceeded: {error_message}", error_code)
-            else:
-                raise BedrockError(f"Bedrock API error ({error_code}): {error_message}", error_code)
+            prefix = _ERROR_PREFIXES.get(error_code)
+            if prefix:
+                raise BedrockError(f"{prefix}: {error_message}", error_code)
+            raise BedrockError(f"Bedrock API error ({error_code}): {error_message}", error_code)
+        
+        except NoCredentialsError:
+            raise BedrockError(_NO_CREDENTIALS_MESSAGE)
         
         except BotoCoreError as e:
             raise NetworkError(f"Network error calling Bedrock: {str(e)}")
         
-        except json.JSONDecodeError as e:
-            raise BedrockError(f"Failed to parse Bedrock response: {str(e)}")
+        except BedrockError:
+            raise
         
         except Exception as e:
             raise BedrockError(f"Unexpected error calling Bedrock: {str(e)}")
     
+    def _iter_stream_events(self, request_body: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield decoded JSON events from invoke_model_with_response_stream"""
+        response = self._runtime_client.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            contentType='application/json',
+            accept='application/json',
+            body=_json_dumps(request_body)
+        )
+        
+        for event in response['body']:
+            chunk = event.get('chunk')
+            if chunk is None:
+                # Error events (e.g. throttlingException) replace the chunk
+                error_type, error = next(iter(event.items()), ('unknown', {}))
+                raise BedrockError(f"Stream error: {error.get('message', error_type)}", error_type)
+            
+            yield self._decode_body(chunk['bytes'])
+    
+    def _decode_body(self, raw_body: bytes) -> Dict[str, Any]:
+        """Decode a JSON payload returned by Bedrock"""
+        try:
+            return _json_loads(raw_body)
+        except ValueError as e:  # json and orjson decode errors are ValueErrors
+            raise BedrockError(f"Bad Bedrock response (head={raw_body[:64]!r}): {str(e)}")
+    
+    def _collect_stream(self, request_body: Dict[str, Any],
+                        on_text: Optional[Callable[[str], None]] = None) -> BedrockResponse:
+        """Aggregate a streamed completion into a BedrockResponse"""
+        content_parts = []
+        input_tokens = 0
+        output_tokens = 0
+        stop_reason = "unknown"
+        
+        for event in self._iter_stream_events(request_body):
+            text = self._extract_stream_text(event)
+            if text:
+                content_parts.append(text)
+                if on_text:
+                    on_text(text)
+            
+            event_stop_reason = self._extract_stream_stop_reason(event)
+            if event_stop_reason:
+                stop_reason = event_stop_reason
+            
+            # Bedrock attaches token usage to the final event for every provider
+            metrics = event.get('amazon-bedrock-invocationMetrics')
+            if metrics:
+                input_tokens = metrics.get('inputTokenCount', 0)
+                output_tokens = metrics.get('outputTokenCount', 0)
+        
+        return BedrockResponse(
+            content=''.join(content_parts),
+            model_id=self.model_id,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            stop_reason=stop_reason,
+            cost_estimate=self._estimate_cost(input_tokens, output_tokens)
+        )
+    
+    def _extract_stream_text(self, event: Dict[str, Any]) -> str:
+        """Extract the text fragment from a stream event based on model type"""
+        _, _, stream_text = self._get_provider_handlers()
+        return stream_text(self, event)
+    
+    def _extract_stream_stop_reason(self, event: Dict[str, Any]) -> Optional[str]:
+        """Extract the stop reason from a stream event, if present"""
+        if event.get('type') == 'message_delta':
+            return event.get('delta', {}).get('stop_reason')
+        if event.get('stop_reason'):
+            return event['stop_reason']
+        if event.get('finish_reason'):
+            return event['finish_reason']
+        choices = event.get('choices')
+        if choices:
+            return choices[0].get('finish_reason')
+        return None
+    
+    def _get_provider_handlers(self) -> Tuple[Callable, Callable, Callable]:
+        """Get (request builder, response parser, stream text extractor) for the model"""
+        try:
+            return self.PROVIDERS[self._model_info.provider]
+        except KeyError:
+            raise BedrockError(f"Unsupported model provider: {self._model_info.provider}")
+    
     def _build_request_body(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
         """Build request body based on model type"""
-        model_info = self.model_manager.get_model_info(self.model_id)
-        
-        if model_info.provider == 'anthropic':
-            return self._build_anthropic_request(prompt, system_prompt)
-        elif model_info.provider == 'meta':
-            return self._build_llama_request(prompt, system_prompt)
-        elif model_info.provider == 'cohere':
-            return self._build_cohere_request(prompt, system_prompt)
-        elif model_info.provider == 'ai21':
-            return self._build_ai21_request(prompt, system_prompt)
-        else:
-            raise BedrockError(f"Unsupported model provider: {model_info.provider}")
+        builder, _, _ = self._get_provider_handlers()
+        return builder(self, prompt, system_prompt)
     
     def _build_anthropic_request(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
         """Build request for Anthropic Claude models"""
-        messages = [{"role": "user", "content": prompt}]
-        
-        request = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-            "messages": messages
-        }
+        request = {**self._request_template, "messages": [{"role": "user", "content": prompt}]}
         
         if system_prompt:
             request["system"] = system_prompt
@@ -214,14 +505,15 @@ class BedrockClient:
         """Build request for Meta Llama models"""
         full_prompt = prompt
         if system_prompt:
-            full_prompt = f"<s>[INST] <<SYS>>\n{system_prompt}\n<</SYS>>\n\n{prompt} [/INST]"
+            # Reuse the wrapped system prefix while the system prompt is unchanged;
+            # stored as one tuple so concurrent callers never see a mismatched pair
+            cached_system_prompt, prefix = self._llama_system_prefix
+            if cached_system_prompt != system_prompt:
+                prefix = f"<s>[INST] <<SYS>>\n{system_prompt}\n<</SYS>>\n\n"
+                self._llama_system_prefix = (system_prompt, prefix)
+            full_prompt = prefix + prompt + " [/INST]"
         
-        return {
-            "prompt": full_prompt,
-            "max_gen_len": self.max_tokens,
-            "temperature": self.temperature,
-            "top_p": 0.9
-        }
+        return {**self._request_template, "prompt": full_prompt}
     
     def _build_cohere_request(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
         """Build request for Cohere models"""
@@ -229,12 +521,7 @@ class BedrockClient:
         if system_prompt:
             full_prompt = f"{system_prompt}\n\n{prompt}"
         
-        return {
-            "message": full_prompt,
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-            "p": 0.9
-        }
+        return {**self._request_template, "message": full_prompt}
     
     def _build_ai21_request(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
         """Build request for AI21 models"""
@@ -242,27 +529,12 @@ class BedrockClient:
         if system_prompt:
             full_prompt = f"{system_prompt}\n\n{prompt}"
         
-        return {
-            "messages": [{"role": "user", "content": full_prompt}],
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-            "top_p": 0.9
-        }
+        return {**self._request_template, "messages": [{"role": "user", "content": full_prompt}]}
     
     def _parse_response(self, response_body: Dict[str, Any]) -> BedrockResponse:
         """Parse response based on model type"""
-        model_info = self.model_manager.get_model_info(self.model_id)
-        
-        if model_info.provider == 'anthropic':
-            return self._parse_anthropic_response(response_body)
-        elif model_info.provider == 'meta':
-            return self._parse_llama_response(response_body)
-        elif model_info.provider == 'cohere':
-            return self._parse_cohere_response(response_body)
-        elif model_info.provider == 'ai21':
-            return self._parse_ai21_response(response_body)
-        else:
-            raise BedrockError(f"Unsupported model provider: {model_info.provider}")
+        _, parser, _ = self._get_provider_handlers()
+        return parser(self, response_body)
     
     def _parse_anthropic_response(self, response_body: Dict[str, Any]) -> BedrockResponse:
         """Parse Anthropic Claude response"""
@@ -276,7 +548,8 @@ class BedrockClient:
         stop_reason = response_body.get("stop_reason", "unknown")
         
         # Estimate cost (approximate pricing)
-        cost_estimate = self._estimate_cost(input_tokens, output_tokens)
+        cost_estimate = (input_tokens * self._input_cost_per_token
+                         + output_tokens * self._output_cost_per_token)
         
         return BedrockResponse(
             content=content,
@@ -293,16 +566,17 @@ class BedrockClient:
         
         # Llama doesn't provide detailed token usage in response
         input_tokens = 0
-        output_tokens = len(content.split()) * 1.3  # Rough estimate
+        output_tokens = _estimate_token_count(content)
         stop_reason = response_body.get("stop_reason", "unknown")
         
-        cost_estimate = self._estimate_cost(input_tokens, output_tokens)
+        cost_estimate = (input_tokens * self._input_cost_per_token
+                         + output_tokens * self._output_cost_per_token)
         
         return BedrockResponse(
             content=content,
             model_id=self.model_id,
-            input_tokens=int(input_tokens),
-            output_tokens=int(output_tokens),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
             stop_reason=stop_reason,
             cost_estimate=cost_estimate
         )
@@ -313,16 +587,17 @@ class BedrockClient:
         
         # Cohere token usage estimation
         input_tokens = 0
-        output_tokens = len(content.split()) * 1.3
+        output_tokens = _estimate_token_count(content)
         stop_reason = "complete"
         
-        cost_estimate = self._estimate_cost(input_tokens, output_tokens)
+        cost_estimate = (input_tokens * self._input_cost_per_token
+                         + output_tokens * self._output_cost_per_token)
         
         return BedrockResponse(
             content=content,
             model_id=self.model_id,
-            input_tokens=int(input_tokens),
-            output_tokens=int(output_tokens),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
             stop_reason=stop_reason,
             cost_estimate=cost_estimate
         )
@@ -339,7 +614,8 @@ class BedrockClient:
         output_tokens = usage.get("completion_tokens", 0)
         stop_reason = "complete"
         
-        cost_estimate = self._estimate_cost(input_tokens, output_tokens)
+        cost_estimate = (input_tokens * self._input_cost_per_token
+                         + output_tokens * self._output_cost_per_token)
         
         return BedrockResponse(
             content=content,
@@ -350,20 +626,45 @@ class BedrockClient:
             cost_estimate=cost_estimate
         )
     
+    def _anthropic_stream_text(self, event: Dict[str, Any]) -> str:
+        """Extract text from an Anthropic Claude stream event"""
+        if event.get('type') == 'content_block_delta':
+            return event.get('delta', {}).get('text', '')
+        return ''
+    
+    def _llama_stream_text(self, event: Dict[str, Any]) -> str:
+        """Extract text from a Meta Llama stream event"""
+        return event.get('generation', '')
+    
+    def _cohere_stream_text(self, event: Dict[str, Any]) -> str:
+        """Extract text from a Cohere stream event"""
+        return event.get('text', '') if not event.get('is_finished') else ''
+    
+    def _ai21_stream_text(self, event: Dict[str, Any]) -> str:
+        """Extract text from an AI21 stream event"""
+        choices = event.get('choices', [])
+        if choices:
+            return choices[0].get('delta', {}).get('content') or ''
+        return ''
+    
+    # provider -> (request builder, response parser, stream text extractor)
+    PROVIDERS = {
+        'anthropic': (_build_anthropic_request, _parse_anthropic_response, _anthropic_stream_text),
+        'meta': (_build_llama_request, _parse_llama_response, _llama_stream_text),
+        'cohere': (_build_cohere_request, _parse_cohere_response, _cohere_stream_text),
+        'ai21': (_build_ai21_request, _parse_ai21_response, _ai21_stream_text),
+    }
+    
     def _estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Estimate cost based on token usage"""
-        model_info = self.model_manager.get_model_info(self.model_id)
-        
-        input_cost = (input_tokens / 1000) * model_info.input_cost_per_1k
-        output_cost = (output_tokens / 1000) * model_info.output_cost_per_1k
-        
-        return input_cost + output_cost
+        return (input_tokens * self._input_cost_per_token
+                + output_tokens * self._output_cost_per_token)
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model"""
-        return self.model_manager.get_model_info(self.model_id).__dict__
+        return asdict(self._model_info)
     
-    def list_available_models(self) -> List[str]:
+    def list_available_models(self) -> Sequence[str]:
         """List available models"""
         return self.model_manager.list_models()
     
@@ -2,10 +2,14 @@
 Model management for AWS Bedrock
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from enum import Enum
 
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -20,7 +24,7 @@ class ModelProvider(Enum):
     AMAZON = "amazon"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ModelInfo:
     """Information about a Bedrock model"""
     model_id: str
@@ -35,126 +39,208 @@ class ModelInfo:
     recommended_for_code: bool = True
 
 
+def _freeze_registry(models: Dict[str, ModelInfo]) -> Mapping[str, ModelInfo]:
+    """Intern model IDs and wrap the registry in a read-only view"""
+    return MappingProxyType({sys.intern(model_id): info for model_id, info in models.items()})
+
+
+# Supported models, shared read-only by every ModelManager
+_MODELS = _freeze_registry({
+    # Anthropic Claude models
+    "anthropic.claude-3-5-sonnet-20241022-v2:0": ModelInfo(
+        model_id="anthropic.claude-3-5-sonnet-20241022-v2:0",
+        provider=ModelProvider.ANTHROPIC.value,
+        name="Claude 3.5 Sonnet",
+        description="Most capable model for complex reasoning and code analysis",
+        max_tokens=8192,
+        input_cost_per_1k=0.003,
+        output_cost_per_1k=0.015,
+        context_window=200000,
+        supports_system_prompt=True,
+        recommended_for_code=True
+    ),
+    
+    "anthropic.claude-3-haiku-20240307-v1:0": ModelInfo(
+        model_id="anthropic.claude-3-haiku-20240307-v1:0",
+        provider=ModelProvider.ANTHROPIC.value,
+        name="Claude 3 Haiku",
+        description="Fastest and most cost-effective model for simple tasks",
+        max_tokens=4096,
+        input_cost_per_1k=0.00025,
+        output_cost_per_1k=0.00125,
+        context_window=200000,
+        supports_system_prompt=True,
+        recommended_for_code=True
+    ),
+    
+    "anthropic.claude-3-sonnet-20240229-v1:0": ModelInfo(
+        model_id="anthropic.claude-3-sonnet-20240229-v1:0",
+        provider=ModelProvider.ANTHROPIC.value,
+        name="Claude 3 Sonnet",
+        description="Balanced model for most use cases",
+        max_tokens=4096,
+        input_cost_per_1k=0.003,
+        output_cost_per_1k=0.015,
+        context_window=200000,
+        supports_system_prompt=True,
+        recommended_for_code=True
+    ),
+    
+    # Meta Llama models
+    "meta.llama3-70b-instruct-v1:0": ModelInfo(
+        model_id="meta.llama3-70b-instruct-v1:0",
+        provider=ModelProvider.META.value,
+        name="Llama 3 70B Instruct",
+        description="Large language model good for complex reasoning",
+        max_tokens=2048,
+        input_cost_per_1k=0.00265,
+        output_cost_per_1k=0.0035,
+        context_window=8192,
+        supports_system_prompt=True,
+        recommended_for_code=True
+    ),
+    
+    "meta.llama3-8b-instruct-v1:0": ModelInfo(
+        model_id="meta.llama3-8b-instruct-v1:0",
+        provider=ModelProvider.META.value,
+        name="Llama 3 8B Instruct",
+        description="Smaller, faster model for basic tasks",
+        max_tokens=2048,
+        input_cost_per_1k=0.0003,
+        output_cost_per_1k=0.0006,
+        context_window=8192,
+        supports_system_prompt=True,
+        recommended_for_code=True
+    ),
+    
+    # Cohere models
+    "cohere.command-r-plus-v1:0": ModelInfo(
+        model_id="cohere.command-r-plus-v1:0",
+        provider=ModelProvider.COHERE.value,
+        name="Command R+",
+        description="Advanced model for complex tasks and reasoning",
+        max_tokens=4000,
+        input_cost_per_1k=0.003,
+        output_cost_per_1k=0.015,
+        context_window=128000,
+        supports_system_prompt=True,
+        recommended_for_code=True
+    ),
+    
+    "cohere.command-r-v1:0": ModelInfo(
+        model_id="cohere.command-r-v1:0",
+        provider=ModelProvider.COHERE.value,
+        name="Command R",
+        description="Balanced model for general use cases",
+        max_tokens=4000,
+        input_cost_per_1k=0.0005,
+        output_cost_per_1k=0.0015,
+        context_window=128000,
+        supports_system_prompt=True,
+        recommended_for_code=True
+    ),
+    
+    # AI21 models
+    "ai21.jamba-instruct-v1:0": ModelInfo(
+        model_id="ai21.jamba-instruct-v1:0",
+        provider=ModelProvider.AI21.value,
+        name="Jamba Instruct",
+        description="Hybrid architecture model with long context",
+        max_tokens=4096,
+        input_cost_per_1k=0.0005,
+        output_cost_per_1k=0.0007,
+        context_window=256000,
+        supports_system_prompt=True,
+        recommended_for_code=True
+    )
+})
+
+
+def _build_provider_info(models: Mapping[str, ModelInfo]) -> Dict[str, Dict[str, Any]]:
+    """Aggregate model lists and capabilities per provider"""
+    providers: Dict[str, Dict[str, Any]] = {}
+    
+    for model_id, model_info in models.items():
+        info = providers.setdefault(model_info.provider, {
+            "models": [],
+            "min_cost": float('inf'),
+            "max_context": 0,
+            "supports_code": False,
+        })
+        info["models"].append(model_id)
+        info["min_cost"] = min(info["min_cost"], model_info.output_cost_per_1k)
+        info["max_context"] = max(info["max_context"], model_info.context_window)
+        info["supports_code"] = info["supports_code"] or model_info.recommended_for_code
+    
+    for info in providers.values():
+        info["models"] = tuple(info["models"])
+    
+    return providers
+
+
+_MODEL_IDS: Tuple[str, ...] = tuple(_MODELS)
+_PROVIDER_INFO = _build_provider_info(_MODELS)
+
+# Models sorted by output cost (cheapest first), overall and per provider
+_BY_COST: Tuple[ModelInfo, ...] = tuple(sorted(_MODELS.values(), key=lambda m: m.output_cost_per_1k))
+_PROVIDER_BY_COST: Dict[str, Tuple[ModelInfo, ...]] = {
+    provider: tuple(m for m in _BY_COST if m.provider == provider)
+    for provider in _PROVIDER_INFO
+}
+
+# Recommended model IDs per use case, best first
+_RECOMMENDATIONS: Dict[str, Tuple[str, ...]] = {
+    # Best models for code review
+    "code_review": (
+        "anthropic.claude-3-5-sonnet-20241022-v2:0",
+        "anthropic.claude-3-sonnet-20240229-v1:0",
+        "meta.llama3-70b-instruct-v1:0",
+        "cohere.command-r-plus-v1:0"
+    ),
+    # Most cost-effective models
+    "cost_optimized": (
+        "anthropic.claude-3-haiku-20240307-v1:0",
+        "meta.llama3-8b-instruct-v1:0",
+        "cohere.command-r-v1:0"
+    ),
+    # Fastest models
+    "performance": (
+        "anthropic.claude-3-haiku-20240307-v1:0",
+        "meta.llama3-8b-instruct-v1:0"
+    ),
+    # Models with largest context windows
+    "long_context": (
+        "ai21.jamba-instruct-v1:0",
+        "anthropic.claude-3-5-sonnet-20241022-v2:0",
+        "cohere.command-r-plus-v1:0"
+    ),
+}
+
+# General recommendations
+_DEFAULT_RECOMMENDATIONS: Tuple[str, ...] = (
+    "anthropic.claude-3-5-sonnet-20241022-v2:0",
+    "anthropic.claude-3-sonnet-20240229-v1:0",
+    "meta.llama3-70b-instruct-v1:0"
+)
+
+
+@lru_cache(maxsize=512)
+def _cost_estimate(input_cost_per_1k: float, output_cost_per_1k: float,
+                   input_tokens: int, output_tokens: int) -> float:
+    """Estimate invocation cost in USD (memoized on primitive arguments)"""
+    return (input_tokens * input_cost_per_1k + output_tokens * output_cost_per_1k) / 1000
+
+
 class ModelManager:
     """Manages Bedrock model information and capabilities"""
     
     def __init__(self):
         """Initialize model manager with supported models"""
-        self._models = self._initialize_models()
-    
-    def _initialize_models(self) -> Dict[str, ModelInfo]:
-        """Initialize supported models with their information"""
-        models = {}
-        
-        # Anthropic Claude models
-        models["anthropic.claude-3-5-sonnet-20241022-v2:0"] = ModelInfo(
-            model_id="anthropic.claude-3-5-sonnet-20241022-v2:0",
-            provider=ModelProvider.ANTHROPIC.value,
-            name="Claude 3.5 Sonnet",
-            description="Most capable model for complex reasoning and code analysis",
-            max_tokens=8192,
-            input_cost_per_1k=0.003,
-            output_cost_per_1k=0.015,
-            context_window=200000,
-            supports_system_prompt=True,
-            recommended_for_code=True
-        )
-        
-        models["anthropic.claude-3-haiku-20240307-v1:0"] = ModelInfo(
-            model_id="anthropic.claude-3-haiku-20240307-v1:0",
-            provider=ModelProvider.ANTHROPIC.value,
-            name="Claude 3 Haiku",
-            description="Fastest and most cost-effective model for simple tasks",
-            max_tokens=4096,
-            input_cost_per_1k=0.00025,
-            output_cost_per_1k=0.00125,
-            context_window=200000,
-            supports_system_prompt=True,
-            recommended_for_code=True
-        )
-        
-        models["anthropic.claude-3-sonnet-20240229-v1:0"] = ModelInfo(
-            model_id="anthropic.claude-3-sonnet-20240229-v1:0",
-            provider=ModelProvider.ANTHROPIC.value,
-            name="Claude 3 Sonnet",
-            description="Balanced model for most use cases",
-            max_tokens=4096,
-            input_cost_per_1k=0.003,
-            output_cost_per_1k=0.015,
-            context_window=200000,
-            supports_system_prompt=True,
-            recommended_for_code=True
-        )
-        
-        # Meta Llama models
-        models["meta.llama3-70b-instruct-v1:0"] = ModelInfo(
-            model_id="meta.llama3-70b-instruct-v1:0",
-            provider=ModelProvider.META.value,
-            name="Llama 3 70B Instruct",
-            description="Large language model good for complex reasoning",
-            max_tokens=2048,
-            input_cost_per_1k=0.00265,
-            output_cost_per_1k=0.0035,
-            context_window=8192,
-            supports_system_prompt=True,
-            recommended_for_code=True
-        )
-        
-        models["meta.llama3-8b-instruct-v1:0"] = ModelInfo(
-            model_id="meta.llama3-8b-instruct-v1:0",
-            provider=ModelProvider.META.value,
-            name="Llama 3 8B Instruct",
-            description="Smaller, faster model for basic tasks",
-            max_tokens=2048,
-            input_cost_per_1k=0.0003,
-            output_cost_per_1k=0.0006,
-            context_window=8192,
-            supports_system_prompt=True,
-            recommended_for_code=True
-        )
-        
-        # Cohere models
-        models["cohere.command-r-plus-v1:0"] = ModelInfo(
-            model_id="cohere.command-r-plus-v1:0",
-            provider=ModelProvider.COHERE.value,
-            name="Command R+",
-            description="Advanced model for complex tasks and reasoning",
-            max_tokens=4000,
-            input_cost_per_1k=0.003,
-            output_cost_per_1k=0.015,
-            context_window=128000,
-            supports_system_prompt=True,
-            recommended_for_code=True
-        )
-        
-        models["cohere.command-r-v1:0"] = ModelInfo(
-            model_id="cohere.command-r-v1:0",
-            provider=ModelProvider.COHERE.value,
-            name="Command R",
-            description="Balanced model for general use cases",
-            max_tokens=4000,
-            input_cost_per_1k=0.0005,
-            output_cost_per_1k=0.0015,
-            context_window=128000,
-            supports_system_prompt=True,
-            recommended_for_code=True
-        )
-        
-        # AI21 models
-        models["ai21.jamba-instruct-v1:0"] = ModelInfo(
-            model_id="ai21.jamba-instruct-v1:0",
-            provider=ModelProvider.AI21.value,
-            name="Jamba Instruct",
-            description="Hybrid architecture model with long context",
-            max_tokens=4096,
-            input_cost_per_1k=0.0005,
-            output_cost_per_1k=0.0007,
-            context_window=256000,
-            supports_system_prompt=True,
-            recommended_for_code=True
-        )
-        
-        return models
+        self._models = _MODELS
+        self._model_ids = _MODEL_IDS
+        self._provider_info = _PROVIDER_INFO
+        self._by_cost = _BY_COST
+        self._provider_by_cost = _PROVIDER_BY_COST
     
     def get_model_info(self, model_id: str) -> ModelInfo:
         """
@@ -174,11 +260,11 @@ class ModelManager:
         
         return self._models[model_id]
     
-    def list_models(self) -> List[str]:
+    def list_models(self) -> Sequence[str]:
         """List all supported model IDs"""
-        return list(self._models.keys())
+        return self._model_ids
     
-    def list_models_by_provider(self, provider: str) -> List[str]:
+    def list_models_by_provider(self, provider: str) -> Sequence[str]:
         """
         List models by provider
         
@@ -186,14 +272,12 @@ class ModelManager:
             provider: Provider name (anthropic, meta, cohere, ai21)
             
         Returns:
-            List of model IDs for the provider
+            Model IDs for the provider
         """
-        return [
-            model_id for model_id, info in self._models.items()
-            if info.provider == provider
-        ]
+        info = self._provider_info.get(provider)
+        return info["models"] if info else ()
     
-    def get_recommended_models(self, use_case: str = "code_review") -> List[str]:
+    def get_recommended_models(self, use_case: str = "code_review") -> Sequence[str]:
         """
         Get recommended models for a specific use case
         
@@ -201,43 +285,9 @@ class ModelManager:
             use_case: Use case (code_review, general, cost_optimized, performance)
             
         Returns:
-            List of recommended model IDs
+            Recommended model IDs, best first
         """
-        if use_case == "code_review":
-            # Best models for code review
-            return [
-                "anthropic.claude-3-5-sonnet-20241022-v2:0",
-                "anthropic.claude-3-sonnet-20240229-v1:0",
-                "meta.llama3-70b-instruct-v1:0",
-                "cohere.command-r-plus-v1:0"
-            ]
-        elif use_case == "cost_optimized":
-            # Most cost-effective models
-            return [
-                "anthropic.claude-3-haiku-20240307-v1:0",
-                "meta.llama3-8b-instruct-v1:0",
-                "cohere.command-r-v1:0"
-            ]
-        elif use_case == "performance":
-            # Fastest models
-            return [
-                "anthropic.claude-3-haiku-20240307-v1:0",
-                "meta.llama3-8b-instruct-v1:0"
-            ]
-        elif use_case == "long_context":
-            # Models with largest context windows
-            return [
-                "ai21.jamba-instruct-v1:0",
-                "anthropic.claude-3-5-sonnet-20241022-v2:0",
-                "cohere.command-r-plus-v1:0"
-            ]
-        else:
-            # General recommendations
-            return [
-                "anthropic.claude-3-5-sonnet-20241022-v2:0",
-                "anthropic.claude-3-sonnet-20240229-v1:0",
-                "meta.llama3-70b-instruct-v1:0"
-            ]
+        return _RECOMMENDATIONS.get(use_case, _DEFAULT_RECOMMENDATIONS)
     
     def is_model_supported(self, model_id: str) -> bool:
         """Check if a model is supported"""
@@ -255,15 +305,13 @@ class ModelManager:
         Returns:
             Estimated cost in USD
         """
-        if not self.is_model_supported(model_id):
+        model_info = self._models.get(model_id)
+        if model_info is None:
             return 0.0
         
-        model_info = self.get_model_info(model_id)
-        
-        input_cost = (input_tokens / 1000) * model_info.input_cost_per_1k
-        output_cost = (output_tokens / 1000) * model_info.output_cost_per_1k
-        
-        return input_cost + output_cost
+        return _cost_estimate(
+            model_info.input_cost_per_1k, model_info.output_cost_per_1k, input_tokens, output_tokens
+        )
     
     def compare_models(self, model_ids: List[str]) -> Dict[str, Dict[str, any]]:
         """
@@ -275,13 +323,14 @@ class ModelManager:
         Returns:
             Dictionary with model comparison data
         """
+        models = self._models
         comparison = {}
         
         for model_id in model_ids:
-            if not self.is_model_supported(model_id):
+            model_info = models.get(model_id)
+            if model_info is None:
                 continue
             
-            model_info = self.get_model_info(model_id)
             comparison[model_id] = {
                 "name": model_info.name,
                 "provider": model_info.provider,
@@ -290,7 +339,10 @@ class ModelManager:
                 "input_cost_per_1k": model_info.input_cost_per_1k,
                 "output_cost_per_1k": model_info.output_cost_per_1k,
                 "recommended_for_code": model_info.recommended_for_code,
-                "cost_per_review_estimate": self.get_cost_estimate(model_id, 2000, 500)  # Typical review
+                # Typical review: 2000 input and 500 output tokens
+                "cost_per_review_estimate": (
+                    2000 * model_info.input_cost_per_1k + 500 * model_info.output_cost_per_1k
+                ) / 1000
             }
         
         return comparison
@@ -299,7 +351,8 @@ class ModelManager:
                              max_cost_per_1k: Optional[float] = None,
                              min_context_window: Optional[int] = None,
                              provider: Optional[str] = None,
-                             code_optimized: bool = True) -> List[str]:
+                             code_optimized: bool = True,
+                             limit: Optional[int] = None) -> List[str]:
         """
         Find models matching specific criteria
         
@@ -308,60 +361,42 @@ class ModelManager:
             min_context_window: Minimum context window size
             provider: Specific provider to filter by
             code_optimized: Whether to only include code-optimized models
+            limit: Maximum number of models to return (cheapest first)
             
         Returns:
             List of matching model IDs
         """
         matching_models = []
         
-        for model_id, model_info in self._models.items():
-            # Check code optimization requirement
-            if code_optimized and not model_info.recommended_for_code:
-                continue
-            
-            # Check provider filter
-            if provider and model_info.provider != provider:
-                continue
+        # Candidates are pre-sorted by cost (cheapest first)
+        if provider:
+            candidates = self._provider_by_cost.get(provider, ())
+        else:
+            candidates = self._by_cost
+        
+        for model_info in candidates:
+            if limit is not None and len(matching_models) >= limit:
+                break
             
-            # Check cost constraint
+            # Check cost constraint; every later model costs at least as much
             if max_cost_per_1k and model_info.output_cost_per_1k > max_cost_per_1k:
+                break
+            
+            # Check code optimization requirement
+            if code_optimized and not model_info.recommended_for_code:
                 continue
             
             # Check context window requirement
             if min_context_window and model_info.context_window < min_context_window:
                 continue
             
-            matching_models.append(model_id)
-        
-        # Sort by cost (cheapest first)
-        matching_models.sort(key=lambda x: self._models[x].output_cost_per_1k)
+            matching_models.append(model_info.model_id)
         
         return matching_models
     
     def get_provider_info(self) -> Dict[str, Dict[str, any]]:
         """Get information about all providers"""
-        providers = {}
-        
-        for model_info in self._models.values():
-            provider = model_info.provider
-            if provider not in providers:
-                providers[provider] = {
-                    "models": [],
-                    "min_cost": float('inf'),
-                    "max_context": 0,
-                    "supports_code": False
-                }
-            
-            providers[provider]["models"].append(model_info.model_id)
-            providers[provider]["min_cost"] = min(
-                providers[provider]["min_cost"], 
-                model_info.output_cost_per_1k
-            )
-            providers[provider]["max_context"] = max(
-                providers[provider]["max_context"], 
-                model_info.context_window
-            )
-            if model_info.recommended_for_code:
-                providers[provider]["supports_code"] = True
-        
-        return providers
\ No newline at end of file
+        return {
+            provider: {**info, "models": list(info["models"])}
+            for provider, info in self._provider_info.items()
+        }
@@ -4,21 +4,26 @@ Command-line interface for AI Code Review
 
 import sys
 import os
+import shlex
 import click
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
-from .config.manager import ConfigManager
-from .git.operations import GitOperations
-from .git.analyzer import ChangeAnalyzer
-from .review.engine import ReviewEngine
-from .ui.interactive import InteractiveUI
 from .utils.exceptions import AICodeReviewError, UserAbortError
 from .utils.logging import setup_logging, get_logger
 
+if TYPE_CHECKING:
+    from .config.manager import ConfigManager
+    from .ui.interactive import InteractiveUI
+
 # Initialize logger (will be configured later)
 logger = get_logger(__name__)
 
+# AI_REVIEW values that disable review without consulting git config
+_DISABLED_VALUES = ('0', 'false', 'no', 'off')
+
 
 @click.group()
 @click.version_option()
@@ -59,6 +64,10 @@ def review(ctx, remote, branch, use_case):
     """Run code review on current changes"""
     
     try:
+        # Heavy components are imported here to keep CLI startup fast
+        from .git.operations import GitOperations, GitRef
+        from .ui.interactive import InteractiveUI
+        
         # Load configuration
         config = _load_config(ctx.obj.get('config_path'))
         
@@ -68,8 +77,6 @@ def review(ctx, remote, branch, use_case):
         
         # Initialize components
         git_ops = GitOperations()
-        analyzer = ChangeAnalyzer(config.to_dict())
-        review_engine = ReviewEngine(config)
         ui = InteractiveUI(config)
         
         # Show startup banner
@@ -79,7 +86,6 @@ def review(ctx, remote, branch, use_case):
         current_branch = git_ops.get_current_branch()
         
         # Create mock git ref for current changes
-        from .git.operations import GitRef
         git_ref = GitRef(
             local_ref=f"refs/heads/{current_branch}",
             local_sha="HEAD",
@@ -88,7 +94,7 @@ def review(ctx, remote, branch, use_case):
         )
         
         # Get changes based on use case
-        with ui.show_progress_spinner("Analyzing git changes"):
+        with ui.show_progress_spinner("Analyzing git changes") or nullcontext():
             if use_case == 'target':
                 changes = git_ops.get_diff_with_remote_target(git_ref, remote)
             else:
@@ -99,57 +105,18 @@ def review(ctx, remote, branch, use_case):
             ui.console.print("[green]✅ No changes to review[/green]")
             return
         
-        # Analyze and filter changes
-        with ui.show_progress_spinner("Filtering changes"):
-            analysis_result = analyzer.analyze_changes(changes)
-        
-        if not analysis_result.filtered_changes:
-            ui.console.print("[yellow]⚠️ No reviewable changes found after filtering[/yellow]")
-            return
-        
-        # Perform review
-        file_progress = ui.show_file_progress(len(analysis_result.filtered_changes))
-        
-        if file_progress:
-            with file_progress:
-                task = file_progress.add_task("Reviewing files...", total=len(analysis_result.filtered_changes))
-                
-                # Mock progress updates (in real implementation, this would be integrated with review engine)
-                review_result = review_engine.review_changes(analysis_result.filtered_changes)
-                file_progress.update(task, completed=len(analysis_result.filtered_changes))
-        else:
-            with ui.show_progress_spinner("Performing AI code review"):
-                review_result = review_engine.review_changes(analysis_result.filtered_changes)
-        
-        # Display results
-        ui.display_review_results(review_result)
-        
-        # Get user decision
-        continue_push = ui.get_user_decision(review_result)
-        
-        # Show final message
-        ui.show_final_message(continue_push, review_result)
-        
-        # Exit with appropriate code
-        if continue_push:
-            sys.exit(0)
-        else:
-            sys.exit(5)  # User aborted
+        sys.exit(_run_review_pipeline(config, ui, changes))
             
     except UserAbortError:
         logger.info("Review aborted by user")
         sys.exit(5)
     except AICodeReviewError as e:
         logger.error(f"Review failed: {e}")
-        if ctx.obj.get('verbose'):
-            import traceback
-            traceback.print_exc()
+        _print_traceback_if_verbose(ctx)
         sys.exit(e.exit_code)
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
-        if ctx.obj.get('verbose'):
-            import traceback
-            traceback.print_exc()
+        _print_traceback_if_verbose(ctx)
         sys.exit(99)
 
 
@@ -165,6 +132,9 @@ def hook(ctx, stdin_input):
             logger.debug("Review not requested, skipping")
             sys.exit(0)
         
+        from .git.operations import GitOperations
+        from .ui.interactive import InteractiveUI
+        
         # Get hook arguments
         if len(sys.argv) < 3:
             logger.error("Invalid hook arguments")
@@ -185,8 +155,6 @@ def hook(ctx, stdin_input):
         
         # Initialize components
         git_ops = GitOperations()
-        analyzer = ChangeAnalyzer(config.to_dict())
-        review_engine = ReviewEngine(config)
         ui = InteractiveUI(config)
         
         # Parse push refs
@@ -195,23 +163,11 @@ def hook(ctx, stdin_input):
             logger.info("No refs to push, skipping review")
             sys.exit(0)
         
-        # Process each ref
+        # Process each ref; a specified branch overrides the target branch comparison
         all_changes = {}
+        compare_branch = os.environ.get('AI_REVIEW_BRANCH')
         
-        for git_ref in refs:
-            logger.debug(f"Processing ref: {git_ref.remote_ref}")
-            
-            # Determine comparison method based on environment
-            compare_branch = os.environ.get('AI_REVIEW_BRANCH')
-            if compare_branch:
-                # Use specified branch comparison
-                ref_changes = git_ops.get_diff_with_specified_branch(
-                    git_ref.local_ref, compare_branch, remote_name
-                )
-            else:
-                # Use target branch comparison (default)
-                ref_changes = git_ops.get_diff_with_remote_target(git_ref, remote_name)
-            
+        for ref_changes in git_ops.get_diffs_for_refs(refs, remote_name, compare_branch):
             all_changes.update(ref_changes)
         
         if not all_changes:
@@ -221,43 +177,26 @@ def hook(ctx, stdin_input):
         # Show startup banner
         ui.show_startup_banner()
         
-        # Analyze changes
-        with ui.show_progress_spinner("Analyzing changes"):
-            analysis_result = analyzer.analyze_changes(all_changes)
-        
-        if not analysis_result.filtered_changes:
-            ui.console.print("[yellow]⚠️ No reviewable changes found[/yellow]")
-            sys.exit(0)
-        
-        # Perform review
-        with ui.show_progress_spinner("Performing AI code review"):
-            review_result = review_engine.review_changes(analysis_result.filtered_changes)
-        
-        # Display results and get decision
-        ui.display_review_results(review_result)
-        continue_push = ui.get_user_decision(review_result)
-        
-        # Show final message
-        ui.show_final_message(continue_push, review_result)
-        
-        # Exit with appropriate code
-        sys.exit(0 if continue_push else 5)
+        sys.exit(_run_review_pipeline(config, ui, all_changes))
         
     except UserAbortError:
         logger.info("Push aborted by user")
         sys.exit(5)
     except AICodeReviewError as e:
         logger.error(f"Hook failed: {e}")
+        _print_traceback_if_verbose(ctx)
         sys.exit(e.exit_code)
     except Exception as e:
         logger.error(f"Unexpected hook error: {e}")
+        _print_traceback_if_verbose(ctx)
         sys.exit(99)
 
 
 @main.command()
 @click.option('--global', 'global_install', is_flag=True, help='Install globally for all repositories')
+@click.option('--python-hook', is_flag=True, help='Install the Python hook script instead of the shell stub')
 @click.pass_context
-def install(ctx, global_install):
+def install(ctx, global_install, python_hook):
     """Install git pre-push hook"""
     
     try:
@@ -266,7 +205,7 @@ def install(ctx, global_install):
         if global_install:
             _install_global_hook(config)
         else:
-            _install_local_hook(config)
+            _install_local_hook(config, python_hook=python_hook)
             
         click.echo("✅ Git hook installed successfully!")
         click.echo("\nUsage:")
@@ -317,6 +256,7 @@ def test(ctx):
         try:
             from .bedrock.client import BedrockClient
             bedrock_client = BedrockClient(config.get('bedrock'))
+            bedrock_client.validate_credentials()
             click.echo("✅ AWS Bedrock connection successful")
         except Exception as e:
             click.echo(f"❌ AWS Bedrock connection failed: {e}")
@@ -324,6 +264,7 @@ def test(ctx):
         
         # Test git repository
         try:
+            from .git.operations import GitOperations
             git_ops = GitOperations()
             repo_info = git_ops.get_repository_info()
             click.echo(f"✅ Git repository detected: {repo_info.get('remote_url', 'local')}")
@@ -338,55 +279,138 @@ def test(ctx):
         sys.exit(1)
 
 
+def _run_review_pipeline(config: 'ConfigManager', ui: 'InteractiveUI', changes: Dict[str, Any]) -> int:
+    """
+    Filter, review and display changes, then ask whether to continue the push
+    
+    Args:
+        config: Configuration manager
+        ui: Interactive UI (startup banner already shown)
+        changes: Changed files to review
+        
+    Returns:
+        Exit code (0 to continue the push, 5 if the user aborted)
+    """
+    from .git.analyzer import ChangeAnalyzer
+    from .review.engine import ReviewEngine
+    
+    analyzer = ChangeAnalyzer(config.view())
+    
+    # Analyze and filter changes
+    with ui.show_progress_spinner("Analyzing changes") or nullcontext():
+        analysis_result = analyzer.analyze_changes(changes)
+    
+    changes_to_review = analysis_result.filtered_changes
+    if not changes_to_review:
+        ui.console.print("[yellow]⚠️ No reviewable changes found after filtering[/yellow]")
+        return 0
+    
+    # Perform review
+    review_engine = ReviewEngine(config)
+    progress = (
+        ui.show_file_progress(len(changes_to_review))
+        or ui.show_progress_spinner("Performing AI code review")
+    )
+    
+    with progress or nullcontext():
+        if progress is not None:
+            task = progress.add_task("Performing AI code review", total=len(changes_to_review))
+        on_file_reviewed = (lambda result: progress.advance(task)) if progress is not None else None
+        
+        review_result = review_engine.review_changes(changes_to_review, on_file_reviewed)
+    
+    # Display results and get decision
+    ui.display_review_results(review_result)
+    continue_push = ui.get_user_decision(review_result)
+    
+    # Show final message
+    ui.show_final_message(continue_push, review_result)
+    
+    return 0 if continue_push else 5
+
+
+def _print_traceback_if_verbose(ctx) -> None:
+    """Print the active exception's traceback when --verbose is set"""
+    if ctx.obj.get('verbose'):
+        import traceback
+        traceback.print_exc()
+
+
 def _should_run_review() -> bool:
     """Check if AI review should be triggered"""
     
-    # Check environment variable
-    if os.environ.get('AI_REVIEW') == '1':
+    # Check environment variable; an explicit opt-out skips the git lookup
+    ai_review = os.environ.get('AI_REVIEW', '').strip().lower()
+    if ai_review == '1':
         return True
+    if ai_review in _DISABLED_VALUES:
+        return False
     
     # Check git config
+    return _git_ai_review_enabled()
+
+
+@lru_cache(maxsize=1)
+def _git_ai_review_enabled() -> bool:
+    """Check the ai.review git config flag (cached per process)"""
+    import subprocess
+    
     try:
-        import subprocess
         result = subprocess.run(
             ['git', 'config', '--get', 'ai.review'],
             capture_output=True,
-            text=True
+            text=True,
+            check=False,
+            stdin=subprocess.DEVNULL,
+            timeout=5
         )
-        if result.returncode == 0 and result.stdout.strip() == 'true':
-            return True
-    except:
-        pass
+    except (OSError, subprocess.SubprocessError):
+        return False
     
-    return False
+    return result.returncode == 0 and result.stdout.strip() == 'true'
 
 
-def _load_config(config_path: Optional[str] = None) -> ConfigManager:
-    """Load configuration"""
+def _load_config(config_path: Optional[str] = None) -> 'ConfigManager':
+    """Load configuration (shared per config path and working directory)"""
     try:
-        if config_path:
-            # TODO: Support custom config path
-            pass
-        
-        return ConfigManager()
+        return _load_config_cached(config_path, os.getcwd())
     except Exception as e:
         logger.error(f"Failed to load configuration: {e}")
         raise AICodeReviewError(f"Configuration error: {e}", exit_code=3)
 
 
-def _install_local_hook(config: ConfigManager) -> None:
-    """Install hook in current repository"""
-    git_dir = Path('.git')
-    if not git_dir.exists():
-        raise AICodeReviewError("Not in a git repository")
-    
-    hooks_dir = git_dir / 'hooks'
-    hooks_dir.mkdir(exist_ok=True)
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path: Optional[str], cwd: str) -> 'ConfigManager':
+    """Construct a ConfigManager; the working directory locates repo config"""
+    from .config.manager import ConfigManager
     
-    hook_path = hooks_dir / 'pre-push'
+    if config_path:
+        # TODO: Support custom config path
+        pass
     
-    # Create hook script
-    hook_content = f"""#!/usr/bin/env python3
+    return ConfigManager()
+
+
+# Hook that decides in sh and starts Python only when review is requested
+_SHELL_HOOK_TEMPLATE = """#!/bin/sh
+# AI Code Review Pre-Push Hook
+
+# If review not requested, exit immediately (allow push)
+# Normalize like _should_run_review: case-insensitive, surrounding whitespace ignored
+ai_review=$(printf '%s' "$AI_REVIEW" | tr '[:upper:]' '[:lower:]' | tr -d '[:space:]')
+case "$ai_review" in
+    1) ;;
+    0|false|no|off) exit 0 ;;
+    *) [ "$(git config --get ai.review 2>/dev/null)" = "true" ] || exit 0 ;;
+esac
+
+# Run AI review
+exec {python} -m ai_code_review.cli hook "$@"
+"""
+
+
+# Standalone Python hook script
+_PYTHON_HOOK_SCRIPT = """#!/usr/bin/env python3
 \"\"\"
 AI Code Review Pre-Push Hook
 \"\"\"
@@ -428,21 +452,47 @@ def main():
         ] + sys.argv[1:], input=sys.stdin.read(), text=True)
         sys.exit(result.returncode)
     except Exception as e:
-        print(f"AI Code Review failed: {{e}}", file=sys.stderr)
+        print(f"AI Code Review failed: {e}", file=sys.stderr)
         sys.exit(99)
 
 if __name__ == '__main__':
     main()
 """
+
+
+def _install_local_hook(config: 'ConfigManager', python_hook: bool = False) -> None:
+    """
+    Install hook in current repository
+    
+    Args:
+        config: Configuration manager
+        python_hook: Install the Python hook script instead of the shell stub
+    """
+    git_dir = Path('.git')
+    if not git_dir.exists():
+        raise AICodeReviewError("Not in a git repository")
+    
+    hooks_dir = git_dir / 'hooks'
+    hooks_dir.mkdir(exist_ok=True)
+    
+    hook_path = hooks_dir / 'pre-push'
+    
+    # Create hook script
+    if python_hook:
+        hook_content = _PYTHON_HOOK_SCRIPT
+    else:
+        hook_content = _SHELL_HOOK_TEMPLATE.format(python=shlex.quote(sys.executable))
     
-    with open(hook_path, 'w') as f:
-        f.write(hook_content)
+    # Create the hook executable from the start
+    fd = os.open(hook_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(hook_content.encode('utf-8'))
     
-    # Make executable
+    # Creation mode is masked by umask and ignored for an existing hook
     hook_path.chmod(0o755)
 
 
-def _install_global_hook(config: ConfigManager) -> None:
+def _install_global_hook(config: 'ConfigManager') -> None:
     """Install hook globally"""
     # TODO: Implement global hook installation
     raise NotImplementedError("Global installation not yet implemented")
@@ -3,18 +3,50 @@ Configuration manager for AI Code Review
 """
 
 import os
+import re
 import yaml
 import fnmatch
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Mapping, Optional, Pattern, Tuple, Union
 from copy import deepcopy
+from dataclasses import dataclass
+from types import MappingProxyType
 
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.exceptions import ConfigurationError
 from ..utils.logging import get_logger
 from .validator import ConfigValidator
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = get_logger(__name__)
 
+# Prefix of environment variables that override configuration values
+_ENV_PREFIX = 'AI_CODE_REVIEW_'
+
+# Environment variable spellings of boolean values
+_ENV_BOOLEANS = {
+    'true': True, 'yes': True, '1': True, 'on': True,
+    'false': False, 'no': False, '0': False, 'off': False,
+}
+
+# rule_templates patterns of the form '*.ext', matched by extension lookup
+_EXTENSION_PATTERN_RE = re.compile(r'^\*\.([A-Za-z0-9_]+)$')
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class _RuleMatcher:
+    """Compiled rule_templates patterns; rules are referenced by configuration order"""
+    templates: Tuple[Tuple[str, ...], ...]
+    by_extension: Dict[str, Tuple[int, ...]]
+    always: Tuple[int, ...]
+    regex: Pattern[str]
+    regex_groups: Tuple[Tuple[str, int], ...]
+
 
 class ConfigManager:
     """
@@ -27,6 +59,9 @@ class ConfigManager:
     4. Environment variables (prefixed with AI_CODE_REVIEW_)
     """
     
+    # Parsed YAML files shared by all instances: path -> (mtime_ns, size, data)
+    _yaml_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+    
     def __init__(self, project_root: Optional[Path] = None):
         """
         Initialize configuration manager
@@ -38,16 +73,35 @@ class ConfigManager:
         self.validator = ConfigValidator()
         self._config = {}
         self._loaded = False
+        self._rule_matcher = None
+        self._flat: Optional[Dict[str, Any]] = None
+        self._sources_signature: Optional[Tuple[Any, ...]] = None
+        self._modified = False
         
         # Load configuration
         self.reload()
     
-    def reload(self) -> None:
-        """Reload configuration from all sources"""
+    def reload(self, force: bool = False) -> None:
+        """
+        Reload configuration from all sources
+        
+        Skipped when no config file or AI_CODE_REVIEW_* variable changed since
+        the last load and set() has not been called.
+        
+        Args:
+            force: Rebuild even if no source changed
+        """
+        signature = self._compute_sources_signature()
+        if (self._loaded and not force and not self._modified
+                and signature == self._sources_signature):
+            logger.debug("Configuration sources unchanged, skipping reload")
+            return
+        
         logger.debug("Reloading configuration")
         
         # Start with default configuration
         self._config = self._load_default_config()
+        self._invalidate_caches()
         
         # Load global user configuration
         self._merge_config(self._load_global_config())
@@ -61,6 +115,8 @@ class ConfigManager:
         # Validate final configuration
         self._validate_config()
         
+        self._sources_signature = signature
+        self._modified = False
         self._loaded = True
         logger.debug("Configuration loaded successfully")
     
@@ -78,15 +134,15 @@ class ConfigManager:
         if not self._loaded:
             self.reload()
         
-        keys = key.split('.')
-        value = self._config
+        # Build the index privately and publish it whole so concurrent readers
+        # never see a partially filled one
+        flat = self._flat
+        if flat is None:
+            flat = {}
+            self._flatten(self._config, '', flat)
+            self._flat = flat
         
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return flat.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -107,6 +163,8 @@ class ConfigManager:
         
         # Set the value
         config[keys[-1]] = value
+        self._modified = True
+        self._invalidate_caches()
     
     def get_rule_templates(self, filename: str) -> List[str]:
         """
@@ -118,26 +176,70 @@ class ConfigManager:
         Returns:
             List of template names
         """
-        rule_templates = self.get('review.rule_templates', {})
-        applicable_templates = []
-        
-        # Find matching patterns (order matters)
-        for pattern, templates in rule_templates.items():
-            if fnmatch.fnmatch(filename, pattern):
-                if isinstance(templates, str):
-                    applicable_templates.append(templates)
-                elif isinstance(templates, list):
-                    applicable_templates.extend(templates)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_templates = []
-        for template in applicable_templates:
-            if template not in seen:
-                seen.add(template)
-                unique_templates.append(template)
-        
-        return unique_templates
+        if self._rule_matcher is None:
+            self._rule_matcher = self._compile_rule_templates()
+        
+        matcher = self._rule_matcher
+        filename = os.path.normcase(filename)
+        
+        # Indices of matching rules: '*' rules, '*.ext' rules, then any other globs
+        matched = list(matcher.always)
+        _, dot, extension = filename.rpartition('.')
+        if dot:
+            matched.extend(matcher.by_extension.get(extension, ()))
+        if matcher.regex_groups:
+            match = matcher.regex.match(filename)
+            matched.extend(index for group, index in matcher.regex_groups if match.group(group) is not None)
+        
+        # Collect templates of matching patterns (order matters), removing duplicates
+        matched.sort()
+        templates = matcher.templates
+        return list(dict.fromkeys(template for index in matched for template in templates[index]))
+    
+    def _compile_rule_templates(self) -> '_RuleMatcher':
+        """
+        Compile rule template patterns for fast matching
+        
+        '*' and '*.ext' patterns are answered by lookups. Other globs are
+        combined into a single regex where each glob is an optional lookahead
+        capturing into its own group, so one match reports all that apply.
+        
+        Returns:
+            Compiled rule matcher
+        """
+        templates = []
+        by_extension: Dict[str, List[int]] = {}
+        always = []
+        parts = []
+        regex_groups = []
+        
+        for pattern, pattern_templates in self.get('review.rule_templates', {}).items():
+            if isinstance(pattern_templates, str):
+                pattern_templates = (pattern_templates,)
+            elif not isinstance(pattern_templates, list):
+                continue
+            
+            index = len(templates)
+            templates.append(tuple(pattern_templates))
+            pattern = os.path.normcase(pattern)
+            
+            extension_match = _EXTENSION_PATTERN_RE.match(pattern)
+            if pattern == '*':
+                always.append(index)
+            elif extension_match:
+                by_extension.setdefault(extension_match.group(1), []).append(index)
+            else:
+                group = f'rule{index}'
+                parts.append(f'(?:(?=(?P<{group}>{fnmatch.translate(pattern)}))|)')
+                regex_groups.append((group, index))
+        
+        return _RuleMatcher(
+            templates=tuple(templates),
+            by_extension={extension: tuple(indices) for extension, indices in by_extension.items()},
+            always=tuple(always),
+            regex=re.compile(''.join(parts)),
+            regex_groups=tuple(regex_groups)
+        )
     
     def validate(self) -> tuple[bool, List[str]]:
         """
@@ -149,20 +251,63 @@ class ConfigManager:
         return self.validator.validate(self._config)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Get configuration as dictionary"""
+        """Get configuration as an independent dictionary (prefer view() for reading)"""
         return deepcopy(self._config)
     
+    def view(self) -> Mapping[str, Any]:
+        """Get a read-only view of the loaded configuration without copying it"""
+        if not self._loaded:
+            self.reload()
+        
+        return MappingProxyType(self._config)
+    
+    def _invalidate_caches(self) -> None:
+        """Drop values derived from the configuration after it changes"""
+        self._rule_matcher = None
+        self._flat = None
+    
+    def _flatten(self, config: Dict[str, Any], prefix: str, index: Dict[str, Any]) -> None:
+        """
+        Index every nested value by its dotted key
+        
+        Keys that are not strings or contain dots cannot be addressed with dot
+        notation and are skipped, along with everything below them.
+        
+        Args:
+            config: Configuration (sub)dictionary
+            prefix: Dotted key of config, empty for the root
+            index: Dictionary receiving dotted key -> value entries
+        """
+        for key, value in config.items():
+            if not isinstance(key, str) or '.' in key:
+                continue
+            
+            dotted_key = f'{prefix}.{key}' if prefix else key
+            index[dotted_key] = value
+            if isinstance(value, dict):
+                self._flatten(value, dotted_key, index)
+    
     def _find_git_root(self) -> Path:
         """Find git repository root"""
-        current = Path.cwd()
+        cwd = os.getcwd()
+        current = cwd
         
-        while current != current.parent:
-            if (current / '.git').exists():
-                return current
-            current = current.parent
+        while True:
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            
+            # .git is a directory in normal clones and a file in worktrees/submodules
+            if os.path.exists(os.path.join(current, '.git')):
+                return Path(current)
+            
+            # Like git, do not search across filesystem boundaries
+            if os.path.ismount(current):
+                break
+            current = parent
         
         # If no git root found, use current directory
-        return Path.cwd()
+        return Path(cwd)
     
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration"""
@@ -176,6 +321,8 @@ class ConfigManager:
                 'timeout': 30,
                 'retry_attempts': 3,
                 'retry_delay': 1,
+                'max_pool_connections': 25,
+                'stream': False,
             },
             'git': {
                 'default_compare_branch': 'main',
@@ -211,6 +358,7 @@ class ConfigManager:
                 'max_issues_per_file': 10,
                 'context_lines': 3,
                 'batch_size': 5,
+                'combine_batches': False,
                 'rule_templates': {
                     '*.py': ['python', 'general'],
                     '*.js': ['javascript', 'general'],
@@ -248,31 +396,68 @@ class ConfigManager:
         
         return default_config
     
+    def _global_config_path(self) -> Path:
+        """Path of the global user configuration file"""
+        return Path.home() / '.ai-code-review' / 'config.yaml'
+    
+    def _project_config_path(self) -> Path:
+        """Path of the project configuration file"""
+        return self.project_root / '.ai-code-review.yaml'
+    
     def _load_global_config(self) -> Dict[str, Any]:
         """Load global user configuration"""
-        global_config_path = Path.home() / '.ai-code-review' / 'config.yaml'
-        return self._load_yaml_file(global_config_path)
+        return self._load_yaml_file(self._global_config_path())
     
     def _load_project_config(self) -> Dict[str, Any]:
         """Load project-specific configuration"""
-        project_config_path = self.project_root / '.ai-code-review.yaml'
-        return self._load_yaml_file(project_config_path)
+        return self._load_yaml_file(self._project_config_path())
+    
+    def _compute_sources_signature(self) -> Tuple[Any, ...]:
+        """Snapshot of the config files' stats and the override variables"""
+        signature = []
+        
+        for path in (self._global_config_path(), self._project_config_path()):
+            try:
+                stat = path.stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        
+        signature.append(tuple(sorted(
+            (env_key, env_value) for env_key, env_value in os.environ.items()
+            if env_key.startswith(_ENV_PREFIX)
+        )))
+        
+        return tuple(signature)
     
     def _load_yaml_file(self, path: Path) -> Dict[str, Any]:
-        """Load YAML configuration file"""
-        if not path.exists():
+        """Load YAML configuration file (reparsed only when it changes)"""
+        try:
+            f = open(path, 'r', encoding='utf-8')
+        except (FileNotFoundError, NotADirectoryError):
             logger.debug(f"Configuration file not found: {path}")
             return {}
-        
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
-            logger.debug(f"Loaded configuration from {path}")
-            return config
-        except yaml.YAMLError as e:
-            raise ConfigurationError(f"Invalid YAML in {path}: {e}")
-        except Exception as e:
+        except OSError as e:
             raise ConfigurationError(f"Failed to load {path}: {e}")
+        
+        with f:
+            stat = os.fstat(f.fileno())
+            cached = self._yaml_cache.get(path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                logger.debug(f"Using cached configuration from {path}")
+                return deepcopy(cached[2])
+            
+            try:
+                config = yaml.load(f, Loader=_SafeLoader) or {}
+                logger.debug(f"Loaded configuration from {path}")
+            except yaml.YAMLError as e:
+                raise ConfigurationError(f"Invalid YAML in {path}: {e}")
+            except Exception as e:
+                raise ConfigurationError(f"Failed to load {path}: {e}")
+        
+        # Merging shares nested values with the live config, so hand out copies
+        self._yaml_cache[path] = (stat.st_mtime_ns, stat.st_size, config)
+        return deepcopy(config)
     
     def _merge_config(self, new_config: Dict[str, Any]) -> None:
         """Merge new configuration into existing configuration"""
@@ -283,37 +468,58 @@ class ConfigManager:
     
     def _deep_merge(self, base: Dict[str, Any], update: Dict[str, Any]) -> None:
         """Deep merge two dictionaries"""
+        if not update or base is update:
+            return
+        
         for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
+            current = base.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                self._deep_merge(current, value)
             else:
                 base[key] = value
     
     def _apply_env_overrides(self) -> None:
         """Apply environment variable overrides"""
-        prefix = 'AI_CODE_REVIEW_'
+        prefix_len = len(_ENV_PREFIX)
         
-        for env_key, env_value in os.environ.items():
-            if not env_key.startswith(prefix):
-                continue
-            
+        # Filter on names only; values are fetched just for matching variables
+        override_keys = [env_key for env_key in os.environ if env_key.startswith(_ENV_PREFIX)]
+        if not override_keys:
+            return
+        
+        # Collect all overrides into one nested dict, then merge it in a single pass
+        overrides: Dict[str, Any] = {}
+        
+        for env_key in override_keys:
             # Convert environment variable name to config key
-            config_key = env_key[len(prefix):].lower().replace('_', '.')
+            config_key = env_key[prefix_len:].lower().replace('_', '.')
             
             # Parse value
-            parsed_value = self._parse_env_value(env_value)
+            parsed_value = self._parse_env_value(os.environ[env_key])
             
-            # Set in configuration
-            self.set(config_key, parsed_value)
+            *parents, leaf = config_key.split('.')
+            target = overrides
+            for k in parents:
+                child = target.get(k)
+                if not isinstance(child, dict):
+                    child = target[k] = {}
+                target = child
+            target[leaf] = parsed_value
             logger.debug(f"Applied environment override: {config_key} = {parsed_value}")
+        
+        self._deep_merge(self._config, overrides)
+        self._invalidate_caches()
     
     def _parse_env_value(self, value: str) -> Union[str, int, float, bool, List[str]]:
         """Parse environment variable value to appropriate type"""
         # Boolean values
-        if value.lower() in ('true', 'yes', '1', 'on'):
-            return True
-        elif value.lower() in ('false', 'no', '0', 'off'):
-            return False
+        boolean = _ENV_BOOLEANS.get(value.lower())
+        if boolean is not None:
+            return boolean
+        
+        # List values (comma-separated); these never parse as numbers
+        if ',' in value:
+            return [item.strip() for item in value.split(',')]
         
         # Numeric values
         try:
@@ -324,10 +530,6 @@ class ConfigManager:
         except ValueError:
             pass
         
-        # List values (comma-separated)
-        if ',' in value:
-            return [item.strip() for item in value.split(',')]
-        
         # String value
         return value
     
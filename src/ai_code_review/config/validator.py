@@ -2,14 +2,33 @@
 Configuration validator for AI Code Review
 """
 
+import fnmatch
+import os
 import re
-from typing import Dict, Any, List, Tuple
-from jsonschema import validate, ValidationError as JsonSchemaValidationError
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from jsonschema.validators import validator_for
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_AWS_REGION_RE = re.compile(r'^[a-z0-9-]+$')
+_TEMPLATE_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_FILE_SIZE_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*([KMGT]?B?)$')
+_INVALID_BRANCH_CHARS_RE = re.compile(r'[~^:?*\[\\ ]')
+
+_CPU_COUNT = os.cpu_count() or 1
+
+# Regions where each provider's models are generally available; providers
+# not listed are assumed available everywhere
+_MODEL_REGION_AVAILABILITY = {
+    # Claude models
+    'anthropic': frozenset({'us-east-1', 'us-west-2', 'eu-west-1'}),
+    # Llama models have different availability
+    'meta': frozenset({'us-east-1', 'us-west-2'}),
+}
+
 
 class ConfigValidator:
     """Validates configuration against schema"""
@@ -30,9 +49,20 @@ class ConfigValidator:
     
     LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
     
+    # Schema and compiled schema validator shared by all instances, built on first use
+    _shared_schema: Optional[Dict[str, Any]] = None
+    _shared_schema_validator: Optional[Any] = None
+    
     def __init__(self):
         """Initialize validator with schema"""
-        self.schema = self._build_schema()
+        if ConfigValidator._shared_schema is None:
+            schema = self._build_schema()
+            validator_cls = validator_for(schema)
+            validator_cls.check_schema(schema)
+            ConfigValidator._shared_schema_validator = validator_cls(schema)
+            ConfigValidator._shared_schema = schema
+        self.schema = ConfigValidator._shared_schema
+        self._schema_validator = ConfigValidator._shared_schema_validator
     
     def validate(self, config: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -44,12 +74,15 @@ class ConfigValidator:
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        errors = []
+        # Validate against JSON schema, collecting every violation
+        errors = [
+            f"Schema validation error: {error.message}"
+            for error in self._schema_validator.iter_errors(config)
+        ]
+        if errors:
+            return False, errors
         
         try:
-            # Validate against JSON schema
-            validate(instance=config, schema=self.schema)
-            
             # Additional custom validations
             errors.extend(self._validate_bedrock_config(config.get('bedrock', {})))
             errors.extend(self._validate_git_config(config.get('git', {})))
@@ -58,8 +91,6 @@ class ConfigValidator:
             errors.extend(self._validate_logging_config(config.get('logging', {})))
             errors.extend(self._validate_performance_config(config.get('performance', {})))
             
-        except JsonSchemaValidationError as e:
-            errors.append(f"Schema validation error: {e.message}")
         except Exception as e:
             errors.append(f"Validation error: {str(e)}")
         
@@ -82,6 +113,8 @@ class ConfigValidator:
                         "timeout": {"type": "integer", "minimum": 1, "maximum": 300},
                         "retry_attempts": {"type": "integer", "minimum": 0, "maximum": 10},
                         "retry_delay": {"type": "number", "minimum": 0.1, "maximum": 60},
+                        "max_pool_connections": {"type": "integer", "minimum": 1, "maximum": 100},
+                        "stream": {"type": "boolean"},
                     },
                     "additionalProperties": False
                 },
@@ -117,6 +150,7 @@ class ConfigValidator:
                         "max_issues_per_file": {"type": "integer", "minimum": 1},
                         "context_lines": {"type": "integer", "minimum": 0},
                         "batch_size": {"type": "integer", "minimum": 1},
+                        "combine_batches": {"type": "boolean"},
                         "rule_templates": {
                             "type": "object",
                             "patternProperties": {
@@ -178,7 +212,7 @@ class ConfigValidator:
         
         # Validate AWS region format
         region = bedrock_config.get('region', '')
-        if region and not re.match(r'^[a-z0-9-]+$', region):
+        if region and not _AWS_REGION_RE.match(region):
             errors.append(f"Invalid AWS region format: {region}")
         
         # Validate model availability in region
@@ -258,12 +292,10 @@ class ConfigValidator:
         
         # Validate worker count vs system capabilities
         max_workers = perf_config.get('max_workers', 4)
-        import os
-        cpu_count = os.cpu_count() or 1
         
-        if max_workers > cpu_count * 2:
+        if max_workers > _CPU_COUNT * 2:
             errors.append(
-                f"max_workers ({max_workers}) is much higher than CPU count ({cpu_count}). "
+                f"max_workers ({max_workers}) is much higher than CPU count ({_CPU_COUNT}). "
                 f"Consider reducing for better performance."
             )
         
@@ -274,17 +306,8 @@ class ConfigValidator:
         # This is a simplified check - in practice, you'd query AWS Bedrock API
         # or maintain a mapping of model availability by region
         
-        # Claude models are generally available in us-east-1, us-west-2, eu-west-1
-        claude_regions = ['us-east-1', 'us-west-2', 'eu-west-1']
-        if model.startswith('anthropic.claude') and region not in claude_regions:
-            return False
-        
-        # Llama models have different availability
-        llama_regions = ['us-east-1', 'us-west-2']
-        if model.startswith('meta.llama') and region not in llama_regions:
-            return False
-        
-        return True
+        regions = _MODEL_REGION_AVAILABILITY.get(model.split('.', 1)[0])
+        return regions is None or region in regions
     
     def _is_valid_branch_name(self, branch: str) -> bool:
         """Validate git branch name format"""
@@ -292,8 +315,7 @@ class ConfigValidator:
             return False
         
         # Git branch name rules (simplified)
-        invalid_chars = ['~', '^', ':', '?', '*', '[', '\\', ' ']
-        if any(char in branch for char in invalid_chars):
+        if _INVALID_BRANCH_CHARS_RE.search(branch):
             return False
         
         if branch.startswith('.') or branch.endswith('.'):
@@ -304,14 +326,15 @@ class ConfigValidator:
         
         return True
     
-    def _is_valid_glob_pattern(self, pattern: str) -> bool:
-        """Validate glob pattern format"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _is_valid_glob_pattern(pattern: str) -> bool:
+        """Validate glob pattern format (memoized)"""
         if not pattern:
             return False
         
         # Basic validation - could be more sophisticated
         try:
-            import fnmatch
             fnmatch.translate(pattern)
             return True
         except Exception:
@@ -323,13 +346,11 @@ class ConfigValidator:
             return False
         
         # Template names should be alphanumeric with underscores/hyphens
-        return re.match(r'^[a-zA-Z0-9_-]+$', template) is not None
+        return _TEMPLATE_NAME_RE.match(template) is not None
     
     def _is_valid_file_size(self, size_str: str) -> bool:
         """Validate file size format"""
         try:
-            pattern = r'^(\d+(?:\.\d+)?)\s*([KMGT]?B?)$'
-            match = re.match(pattern, size_str.upper().strip())
-            return match is not None
+            return _FILE_SIZE_RE.match(size_str.upper().strip()) is not None
         except Exception:
             return False
\ No newline at end of file
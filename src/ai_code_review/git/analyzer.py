@@ -3,7 +3,10 @@ Change analyzer for AI Code Review
 """
 
 import fnmatch
-from pathlib import Path
+import heapq
+import os
+import re
+from functools import lru_cache
 from typing import Dict, List, Set, Optional
 from dataclasses import dataclass
 
@@ -13,6 +16,56 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _compile_globs(patterns: List[str], ignore_case: bool = False) -> 're.Pattern[str]':
+    """
+    Translate glob patterns into a single compiled alternation
+    
+    Patterns are passed through os.path.normcase like fnmatch.fnmatch does, so
+    callers must normcase the filename they match against.
+    
+    Args:
+        patterns: fnmatch-style glob patterns
+        ignore_case: Whether to match case-insensitively
+        
+    Returns:
+        Compiled pattern; never matches when no patterns are given
+    """
+    if not patterns:
+        return re.compile(r'(?!)')
+    
+    return re.compile(
+        '|'.join(f'(?:{fnmatch.translate(os.path.normcase(pattern))})' for pattern in patterns),
+        re.IGNORECASE if ignore_case else 0
+    )
+
+
+# Security-sensitive and configuration file patterns used by prioritize_files
+_SECURITY_RE = _compile_globs(['*auth*', '*security*', '*password*', '*token*', '*key*'], ignore_case=True)
+_CONFIG_RE = _compile_globs(['*.config.*', '*.env*', 'Dockerfile*', '*.yml', '*.yaml'])
+
+# Git status letter -> category used by categorize_changes
+_STATUS_CATEGORIES = {
+    'A': 'added',
+    'M': 'modified',
+    'D': 'deleted',
+    'R': 'renamed',
+    'C': 'copied',
+}
+
+# Git status letter -> counter updated by get_change_statistics
+_STATUS_STAT_KEYS = {
+    'A': 'files_added',
+    'M': 'files_modified',
+    'D': 'files_deleted',
+    'R': 'files_renamed',
+}
+
+_DIFF_HEADER_PREFIXES = ('diff --git', 'index ', '---', '+++')
+
+_HIGH_PRIORITY_EXTENSIONS = frozenset(['.py', '.js', '.ts', '.java', '.go', '.rs'])
+_MEDIUM_PRIORITY_EXTENSIONS = frozenset(['.jsx', '.tsx', '.cpp', '.c', '.cs'])
+
+
 @dataclass
 class AnalysisResult:
     """Result of change analysis"""
@@ -41,9 +94,13 @@ class ChangeAnalyzer:
         # Extract configuration values
         self.exclude_patterns = self.git_config.get('exclude_patterns', [])
         self.include_patterns = self.git_config.get('include_patterns', [])
-        self.binary_extensions = self.git_config.get('binary_file_extensions', [])
+        self.binary_extensions = frozenset(self.git_config.get('binary_file_extensions', []))
         self.max_diff_size = self.git_config.get('max_diff_size', 10000)
         self.max_files = self.git_config.get('max_files', 50)
+        
+        # Globs are translated once so each filename check is a single regex match
+        self._exclude_re = _compile_globs(self.exclude_patterns)
+        self._include_re = _compile_globs(self.include_patterns)
     
     def analyze_changes(self, changes: Dict[str, FileChange]) -> AnalysisResult:
         """
@@ -85,10 +142,9 @@ class ChangeAnalyzer:
                 continue
             
             # Check if diff is too large
-            total_change_lines = change.lines_added + change.lines_removed
-            if total_change_lines > self.max_diff_size:
+            if change.total_lines > self.max_diff_size:
                 large_files.append(filename)
-                logger.debug(f"Excluded {filename} (too large: {total_change_lines} lines)")
+                logger.debug(f"Excluded {filename} (too large: {change.total_lines} lines)")
                 continue
             
             # File passes all filters
@@ -100,19 +156,20 @@ class ChangeAnalyzer:
         if len(filtered_changes) > self.max_files:
             logger.warning(f"Too many files ({len(filtered_changes)}), limiting to {self.max_files}")
             
-            # Sort by change size (largest first) and take top files
-            sorted_files = sorted(
-                filtered_changes.items(),
-                key=lambda x: x[1].lines_added + x[1].lines_removed,
-                reverse=True
-            )
+            # Keep the largest changes without sorting the whole set
+            kept_files = set(heapq.nlargest(
+                self.max_files,
+                filtered_changes,
+                key=lambda f: filtered_changes[f].total_lines
+            ))
             
-            limited_changes = dict(sorted_files[:self.max_files])
-            excluded_count = len(filtered_changes) - self.max_files
-            excluded_files.extend([f for f, _ in sorted_files[self.max_files:]])
+            # Drop the rest in place rather than rebuilding the dict
+            dropped_files = [f for f in filtered_changes if f not in kept_files]
+            excluded_files.extend(dropped_files)
+            for filename in dropped_files:
+                del filtered_changes[filename]
             
-            logger.info(f"Limited to {self.max_files} files, excluded {excluded_count} additional files")
-            filtered_changes = limited_changes
+            logger.info(f"Limited to {self.max_files} files, excluded {len(dropped_files)} additional files")
         
         result = AnalysisResult(
             filtered_changes=filtered_changes,
@@ -132,25 +189,38 @@ class ChangeAnalyzer:
     
     def _should_exclude_file(self, filename: str) -> bool:
         """Check if file matches exclude patterns"""
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-        return False
+        return self._exclude_re.match(os.path.normcase(filename)) is not None
     
     def _should_include_file(self, filename: str) -> bool:
         """Check if file matches include patterns"""
         if not self.include_patterns:
             return True
         
-        for pattern in self.include_patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-        return False
+        return self._include_re.match(os.path.normcase(filename)) is not None
     
     def _is_binary_file(self, filename: str) -> bool:
         """Check if file is binary based on extension"""
-        file_ext = Path(filename).suffix.lower()
-        return file_ext in self.binary_extensions
+        return self._ext(filename) in self.binary_extensions
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _ext(filename: str) -> str:
+        """
+        Get the lowercased extension of a filename
+        
+        Mirrors ``Path(filename).suffix.lower()`` using plain string operations.
+        
+        Args:
+            filename: File path as reported by git
+            
+        Returns:
+            Extension including the leading dot, or empty string
+        """
+        name = filename.rpartition('/')[2]
+        index = name.rfind('.')
+        if 0 < index < len(name) - 1:
+            return name[index:].lower()
+        return ''
     
     def categorize_changes(self, changes: Dict[str, FileChange]) -> Dict[str, List[str]]:
         """
@@ -162,25 +232,12 @@ class ChangeAnalyzer:
         Returns:
             Dictionary of category -> list of filenames
         """
-        categories = {
-            'added': [],
-            'modified': [],
-            'deleted': [],
-            'renamed': [],
-            'copied': []
-        }
+        categories = {category: [] for category in _STATUS_CATEGORIES.values()}
         
         for filename, change in changes.items():
-            if change.status == 'A':
-                categories['added'].append(filename)
-            elif change.status == 'M':
-                categories['modified'].append(filename)
-            elif change.status == 'D':
-                categories['deleted'].append(filename)
-            elif change.status == 'R':
-                categories['renamed'].append(filename)
-            elif change.status == 'C':
-                categories['copied'].append(filename)
+            category = _STATUS_CATEGORIES.get(change.status)
+            if category:
+                categories[category].append(filename)
         
         return categories
     
@@ -197,7 +254,7 @@ class ChangeAnalyzer:
         file_types = {}
         
         for filename in changes.keys():
-            file_ext = Path(filename).suffix.lower()
+            file_ext = self._ext(filename)
             if not file_ext:
                 file_ext = 'no_extension'
             
@@ -233,17 +290,12 @@ class ChangeAnalyzer:
             stats['total_lines_added'] += change.lines_added
             stats['total_lines_removed'] += change.lines_removed
             
-            if change.status == 'A':
-                stats['files_added'] += 1
-            elif change.status == 'M':
-                stats['files_modified'] += 1
-            elif change.status == 'D':
-                stats['files_deleted'] += 1
-            elif change.status == 'R':
-                stats['files_renamed'] += 1
+            stat_key = _STATUS_STAT_KEYS.get(change.status)
+            if stat_key:
+                stats[stat_key] += 1
             
             # Track largest and smallest changes
-            total_lines = change.lines_added + change.lines_removed
+            total_lines = change.total_lines
             if total_lines > stats['largest_change']:
                 stats['largest_change'] = total_lines
             if total_lines < stats['smallest_change']:
@@ -269,41 +321,30 @@ class ChangeAnalyzer:
         chunked_diffs = {}
         
         for filename, change in changes.items():
-            diff_lines = change.diff.split('\n')
+            diff = change.diff
             
-            if len(diff_lines) <= chunk_size:
+            # A diff of N lines contains N - 1 newlines; count them without splitting
+            if diff.count('\n') < chunk_size:
                 # Small diff, no chunking needed
-                chunked_diffs[filename] = [change.diff]
+                chunked_diffs[filename] = [diff]
             else:
                 # Large diff, split into chunks
-                chunks = []
-                current_chunk = []
-                header_lines = []
+                diff_lines = diff.split('\n')
                 
                 # Extract diff header
+                header_count = 0
                 for line in diff_lines:
-                    if line.startswith('diff --git') or line.startswith('index ') or \
-                       line.startswith('---') or line.startswith('+++'):
-                        header_lines.append(line)
-                    else:
+                    if not line.startswith(_DIFF_HEADER_PREFIXES):
                         break
+                    header_count += 1
+                header = '\n'.join(diff_lines[:header_count]) + '\n' if header_count else ''
                 
-                # Process remaining lines
-                content_lines = diff_lines[len(header_lines):]
-                
-                for line in content_lines:
-                    current_chunk.append(line)
-                    
-                    if len(current_chunk) >= chunk_size:
-                        # Create chunk with header
-                        chunk_content = header_lines + current_chunk
-                        chunks.append('\n'.join(chunk_content))
-                        current_chunk = []
-                
-                # Add remaining lines as final chunk
-                if current_chunk:
-                    chunk_content = header_lines + current_chunk
-                    chunks.append('\n'.join(chunk_content))
+                # Slice the remaining lines into chunks, each prefixed with the header
+                step = max(chunk_size, 1)
+                chunks = [
+                    header + '\n'.join(diff_lines[start:start + step])
+                    for start in range(header_count, len(diff_lines), step)
+                ]
                 
                 chunked_diffs[filename] = chunks
                 logger.debug(f"Split {filename} diff into {len(chunks)} chunks")
@@ -325,17 +366,14 @@ class ChangeAnalyzer:
             score = 0.0
             
             # Size of change (more lines = higher priority)
-            total_lines = change.lines_added + change.lines_removed
-            score += total_lines * 0.1
+            score += change.total_lines * 0.1
             
             # File type priorities
-            file_ext = Path(filename).suffix.lower()
-            high_priority_extensions = ['.py', '.js', '.ts', '.java', '.go', '.rs']
-            medium_priority_extensions = ['.jsx', '.tsx', '.cpp', '.c', '.cs']
+            file_ext = self._ext(filename)
             
-            if file_ext in high_priority_extensions:
+            if file_ext in _HIGH_PRIORITY_EXTENSIONS:
                 score += 100
-            elif file_ext in medium_priority_extensions:
+            elif file_ext in _MEDIUM_PRIORITY_EXTENSIONS:
                 score += 50
             
             # New files get higher priority
@@ -343,13 +381,11 @@ class ChangeAnalyzer:
                 score += 75
             
             # Security-sensitive files
-            security_patterns = ['*auth*', '*security*', '*password*', '*token*', '*key*']
-            if any(fnmatch.fnmatch(filename.lower(), pattern) for pattern in security_patterns):
+            if _SECURITY_RE.match(filename):
                 score += 200
             
             # Configuration files
-            config_patterns = ['*.config.*', '*.env*', 'Dockerfile*', '*.yml', '*.yaml']
-            if any(fnmatch.fnmatch(filename, pattern) for pattern in config_patterns):
+            if _CONFIG_RE.match(os.path.normcase(filename)):
                 score += 150
             
             return score
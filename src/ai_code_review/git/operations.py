@@ -5,9 +5,11 @@ Git operations for AI Code Review
 import os
 import subprocess
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, NamedTuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..utils.exceptions import GitError
 from ..utils.logging import get_logger, log_performance
@@ -40,11 +42,30 @@ class FileChange:
     lines_removed: int
     diff: str
     old_filename: Optional[str] = None  # For renamed files
+    total_lines: int = field(init=False)  # lines_added + lines_removed
+    
+    def __post_init__(self):
+        self.total_lines = self.lines_added + self.lines_removed
 
 
 class GitOperations:
     """Handles git operations for code review"""
     
+    # One pre-push stdin line: "<local ref> <local sha> <remote ref> <remote sha>";
+    # anything else on a non-blank line is captured as malformed
+    _REF_LINE_RE = re.compile(
+        r'^[^\S\n]*(?:(\S+)[^\S\n]+(\S+)[^\S\n]+(\S+)[^\S\n]+(\S+)|(.*?))[^\S\n]*$',
+        re.MULTILINE
+    )
+    
+    # Extensions treated as binary by is_file_binary
+    _BINARY_EXTENSIONS = (
+        '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff',
+        '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+        '.zip', '.tar', '.gz', '.rar', '.7z',
+        '.exe', '.dll', '.so', '.dylib'
+    )
+    
     def __init__(self, repo_path: Optional[Path] = None):
         """
         Initialize git operations
@@ -53,6 +74,13 @@ class GitOperations:
             repo_path: Path to git repository (defaults to current directory)
         """
         self.repo_path = repo_path or Path.cwd()
+        # Concurrent fetches would contend for the same ref and FETCH_HEAD locks
+        self._fetch_lock = threading.Lock()
+        
+        # Per-instance caches; each lookup otherwise costs a git subprocess
+        self._fetch_results: Dict[Tuple[str, str], bool] = {}
+        self._branch_cache: Dict[Tuple[str, Optional[str]], bool] = {}
+        self._repository_info: Optional[Dict[str, str]] = None
         self._validate_git_repo()
     
     def _validate_git_repo(self) -> None:
@@ -105,6 +133,39 @@ class GitOperations:
         except FileNotFoundError:
             raise GitError("Git command not found. Please ensure git is installed and in PATH.")
     
+    def _run_git_command_bytes(self, args: List[str]) -> bytes:
+        """
+        Run a git command and return its raw output
+        
+        Used for potentially large outputs such as diffs, which are decoded
+        once by the caller instead of through the locale codec.
+        
+        Args:
+            args: Git command arguments
+            
+        Returns:
+            Command stdout as bytes
+            
+        Raises:
+            GitError: If command fails
+        """
+        cmd = ['git'] + args
+        logger.debug(f"Running git command: {' '.join(cmd)}")
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=self.repo_path,
+                capture_output=True,
+                check=True
+            )
+            return result.stdout
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode('utf-8', errors='replace').strip() if e.stderr else str(e)
+            raise GitError(f"Git command failed: {error_msg}", command=' '.join(cmd))
+        except FileNotFoundError:
+            raise GitError("Git command not found. Please ensure git is installed and in PATH.")
+    
     def parse_push_refs(self, stdin_input: str) -> List[GitRef]:
         """
         Parse git push refs from stdin
@@ -117,17 +178,14 @@ class GitOperations:
         """
         refs = []
         
-        for line in stdin_input.strip().split('\n'):
-            if not line:
-                continue
+        for match in self._REF_LINE_RE.finditer(stdin_input):
+            local_ref, local_sha, remote_ref, remote_sha, malformed = match.groups()
             
-            parts = line.split()
-            if len(parts) != 4:
-                logger.warning(f"Invalid ref line: {line}")
+            if local_ref is None:
+                if malformed:
+                    logger.warning(f"Invalid ref line: {malformed}")
                 continue
             
-            local_ref, local_sha, remote_ref, remote_sha = parts
-            
             # Skip deleted refs
             if local_sha == '0000000000000000000000000000000000000000':
                 logger.debug(f"Skipping deleted ref: {remote_ref}")
@@ -161,20 +219,35 @@ class GitOperations:
         Returns:
             True if branch exists
         """
+        key = (branch, remote)
+        exists = self._branch_cache.get(key)
+        if exists is not None:
+            return exists
+        
         try:
             if remote:
                 ref = f"{remote}/{branch}"
                 self._run_git_command(['rev-parse', '--verify', ref])
             else:
                 self._run_git_command(['rev-parse', '--verify', branch])
-            return True
+            exists = True
         except GitError:
-            return False
+            exists = False
+        
+        self._branch_cache[key] = exists
+        return exists
+    
+    def _invalidate_branch_cache(self) -> None:
+        """Forget cached branch lookups after refs may have changed"""
+        self._branch_cache.clear()
     
     def fetch_remote_branch(self, remote: str, branch: str) -> bool:
         """
         Fetch a remote branch
         
+        Each branch is fetched at most once per instance; later calls reuse
+        the first result.
+        
         Args:
             remote: Remote name
             branch: Branch name
@@ -182,13 +255,24 @@ class GitOperations:
         Returns:
             True if successful
         """
-        try:
-            self._run_git_command(['fetch', remote, branch], check_output=False)
-            logger.debug(f"Fetched {remote}/{branch}")
-            return True
-        except GitError as e:
-            logger.warning(f"Failed to fetch {remote}/{branch}: {e}")
-            return False
+        key = (remote, branch)
+        
+        with self._fetch_lock:
+            if key in self._fetch_results:
+                return self._fetch_results[key]
+            
+            try:
+                self._run_git_command(['fetch', remote, branch], check_output=False)
+                logger.debug(f"Fetched {remote}/{branch}")
+                fetched = True
+            except GitError as e:
+                logger.warning(f"Failed to fetch {remote}/{branch}: {e}")
+                fetched = False
+            
+            self._fetch_results[key] = fetched
+            if fetched:
+                self._invalidate_branch_cache()
+            return fetched
     
     @log_performance
     def get_diff_with_remote_target(self, git_ref: GitRef, remote: str) -> Dict[str, FileChange]:
@@ -242,6 +326,36 @@ class GitOperations:
         
         return self._get_diff_between_refs(local_ref, remote_ref)
     
+    def get_diffs_for_refs(self, refs: List[GitRef], remote: str, compare_branch: Optional[str] = None,
+                           max_workers: int = 8) -> List[Dict[str, FileChange]]:
+        """
+        Get diffs for several pushed refs concurrently
+        
+        Each diff runs in its own git processes, so refs are processed in a
+        thread pool; fetches are serialized by fetch_remote_branch.
+        
+        Args:
+            refs: Git references being pushed
+            remote: Remote name
+            compare_branch: Branch to compare with instead of each ref's target (optional)
+            max_workers: Maximum refs processed at once
+            
+        Returns:
+            List of filename -> FileChange dictionaries in the same order as refs
+        """
+        def diff_for_ref(git_ref: GitRef) -> Dict[str, FileChange]:
+            logger.debug(f"Processing ref: {git_ref.remote_ref}")
+            if compare_branch:
+                return self.get_diff_with_specified_branch(git_ref.local_ref, compare_branch, remote)
+            return self.get_diff_with_remote_target(git_ref, remote)
+        
+        max_workers = min(max_workers, len(refs))
+        if max_workers <= 1:
+            return [diff_for_ref(git_ref) for git_ref in refs]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(diff_for_ref, refs))
+    
     def _get_diff_with_empty_tree(self, local_ref: str) -> Dict[str, FileChange]:
         """Get diff with empty tree (for new branches)"""
         empty_tree = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"  # Git's empty tree hash
@@ -260,54 +374,128 @@ class GitOperations:
         """
         logger.debug(f"Getting diff between {remote_ref} and {local_ref}")
         
-        # Get list of changed files with status
+        # One git call yields status, line counts and patches for every file
         try:
-            name_status = self._run_git_command([
-                'diff', '--name-status', f"{remote_ref}..{local_ref}"
-            ])
+            output = self._run_git_command_bytes([
+                'diff', '--raw', '--numstat', '--patch', '-z', f"{remote_ref}..{local_ref}"
+            ]).decode('utf-8', errors='replace')
         except GitError as e:
-            logger.error(f"Failed to get diff name-status: {e}")
+            logger.error(f"Failed to get diff: {e}")
             return {}
         
+        entries, patch = self._parse_raw_numstat(output)
+        file_diffs = self._split_patch(patch, entries)
+        
         changes = {}
         
-        for line in name_status.split('\n'):
-            if not line.strip():
-                continue
+        for index, (status, filename, old_filename, lines_added, lines_removed) in enumerate(entries):
+            if file_diffs is not None:
+                file_diff = file_diffs[index]
+            else:
+                # Patch sections could not be matched up; ask git per file instead
+                try:
+                    file_diff = self._get_file_diff(remote_ref, local_ref, filename, old_filename)
+                except GitError as e:
+                    logger.warning(f"Failed to get diff for {filename}: {e}")
+                    continue
             
-            parts = line.split('\t')
-            if len(parts) < 2:
-                continue
+            changes[filename] = FileChange(
+                filename=filename,
+                status=status[0],  # Take first character (A, M, D, R, C)
+                lines_added=lines_added,
+                lines_removed=lines_removed,
+                diff=file_diff,
+                old_filename=old_filename
+            )
+        
+        logger.info(f"Found {len(changes)} changed files")
+        return changes
+    
+    @staticmethod
+    def _parse_raw_numstat(output: str) -> Tuple[List[Tuple[str, str, Optional[str], int, int]], str]:
+        """
+        Parse the NUL-separated ``--raw --numstat`` header of a batched diff
+        
+        Args:
+            output: Output of ``git diff --raw --numstat --patch -z``
             
-            status = parts[0]
-            filename = parts[1]
+        Returns:
+            Tuple of (entries, patch) where each entry is
+            (status, filename, old_filename, lines_added, lines_removed)
+        """
+        pos = 0
+        
+        def next_field() -> str:
+            nonlocal pos
+            end = output.find('\0', pos)
+            if end < 0:
+                end = len(output)
+            field = output[pos:end]
+            pos = end + 1
+            return field
+        
+        # Raw records: ":<modes> <shas> <status>\0<path>\0[<new path>\0]"
+        raw = []
+        while output.startswith(':', pos):
+            status = next_field().rsplit(' ', 1)[-1]
+            filename = next_field()
             old_filename = None
+            if status[0] in 'RC':
+                old_filename, filename = filename, next_field()
+            raw.append((status, filename, None if status[0] == 'C' else old_filename))
+        
+        # Numstat records in the same order: "<added>\t<removed>\t<path>\0",
+        # with an empty path followed by two path fields for renames and copies
+        entries = []
+        for status, filename, old_filename in raw:
+            added, removed, path = next_field().split('\t', 2)
+            if not path and status[0] in 'RC':
+                next_field()
+                next_field()
+            # Binary files report "-" for both counts
+            entries.append((
+                status, filename, old_filename,
+                int(added) if added != '-' else 0,
+                int(removed) if removed != '-' else 0
+            ))
+        
+        # An empty field separates the header from the patch
+        if output.startswith('\0', pos):
+            pos += 1
+        
+        return entries, output[pos:]
+    
+    @staticmethod
+    def _split_patch(patch: str, entries: List[Tuple[str, str, Optional[str], int, int]]) -> Optional[List[str]]:
+        """
+        Split a combined patch into per-file diffs
+        
+        Args:
+            patch: Patch text following the raw/numstat header
+            entries: Parsed entries in diff order
             
-            # Handle renamed files
-            if status.startswith('R') and len(parts) >= 3:
-                old_filename = filename
-                filename = parts[2]
-            
-            # Get detailed diff for this file
-            try:
-                file_diff = self._get_file_diff(remote_ref, local_ref, filename, old_filename)
-                lines_added, lines_removed = self._count_diff_lines(file_diff)
-                
-                changes[filename] = FileChange(
-                    filename=filename,
-                    status=status[0],  # Take first character (A, M, D, R, C)
-                    lines_added=lines_added,
-                    lines_removed=lines_removed,
-                    diff=file_diff,
-                    old_filename=old_filename
-                )
-                
-            except GitError as e:
-                logger.warning(f"Failed to get diff for {filename}: {e}")
-                continue
+        Returns:
+            List of diffs aligned with entries, or None if they don't line up
+        """
+        if not entries:
+            return []
+        if not patch.startswith('diff --git '):
+            return None
         
-        logger.info(f"Found {len(changes)} changed files")
-        return changes
+        sections = patch.split('\ndiff --git ')
+        sections[1:] = ['diff --git ' + section for section in sections[1:]]
+        
+        file_diffs = []
+        index = 0
+        for entry in entries:
+            # Type changes (e.g. file to symlink) are shown as a deletion plus an addition
+            count = 2 if entry[0] == 'T' else 1
+            if index + count > len(sections):
+                return None
+            file_diffs.append('\n'.join(section.rstrip('\n') for section in sections[index:index + count]))
+            index += count
+        
+        return file_diffs if index == len(sections) else None
     
     def _get_file_diff(self, remote_ref: str, local_ref: str, filename: str, old_filename: str = None) -> str:
         """Get diff for a specific file"""
@@ -329,14 +517,10 @@ class GitOperations:
         Returns:
             Tuple of (lines_added, lines_removed)
         """
-        lines_added = 0
-        lines_removed = 0
-        
-        for line in diff.split('\n'):
-            if line.startswith('+') and not line.startswith('+++'):
-                lines_added += 1
-            elif line.startswith('-') and not line.startswith('---'):
-                lines_removed += 1
+        # Count line prefixes with C-level substring scans instead of a per-line loop
+        text = '\n' + diff
+        lines_added = text.count('\n+') - text.count('\n+++')
+        lines_removed = text.count('\n-') - text.count('\n---')
         
         return lines_added, lines_removed
     
@@ -356,6 +540,9 @@ class GitOperations:
     
     def get_repository_info(self) -> Dict[str, str]:
         """Get repository information"""
+        if self._repository_info is not None:
+            return dict(self._repository_info)
+        
         info = {}
         
         try:
@@ -373,7 +560,8 @@ class GitOperations:
         except GitError:
             info['head_commit'] = ""
         
-        return info
+        self._repository_info = info
+        return dict(info)
     
     def is_file_binary(self, filename: str, ref: str = "HEAD") -> bool:
         """
@@ -395,14 +583,7 @@ class GitOperations:
                 return True
             
             # Also check file extension
-            binary_extensions = [
-                '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff',
-                '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-                '.zip', '.tar', '.gz', '.rar', '.7z',
-                '.exe', '.dll', '.so', '.dylib'
-            ]
-            
-            return any(filename.lower().endswith(ext) for ext in binary_extensions)
+            return filename.lower().endswith(self._BINARY_EXTENSIONS)
             
         except GitError:
             # If we can't determine, assume it's not binary
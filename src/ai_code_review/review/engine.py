@@ -2,14 +2,18 @@
 Core review engine for AI Code Review
 """
 
+import hashlib
 import json
+import struct
 import asyncio
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import asdict
 from pathlib import Path
 
 from ..git.operations import FileChange
+from ..bedrock.cache import DEFAULT_CACHE_DIR, ResponseCache
 from ..bedrock.client import BedrockClient, BedrockResponse
 from ..config.manager import ConfigManager
 from ..utils.exceptions import BedrockError, ValidationError
@@ -19,6 +23,82 @@ from .models import ReviewIssue, FileReviewResult, ReviewResult
 
 logger = get_logger(__name__)
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+    _json_loads = json.loads
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Bump whenever FileReviewResult/ReviewIssue fields change so stale review cache entries miss
+_REVIEW_CACHE_VERSION = 1
+
+# Severity ranking used for threshold filtering
+_SEVERITY_LEVELS = {'suggestion': 1, 'info': 2, 'warning': 3, 'error': 4}
+
+# Human-readable git status descriptions used in review prompts
+_CHANGE_TYPE_DESCRIPTIONS = {
+    'A': 'Added (new file)',
+    'M': 'Modified (existing file)',
+    'D': 'Deleted (removed file)',
+    'R': 'Renamed (moved file)',
+    'C': 'Copied (duplicated file)'
+}
+
+# The system prompt does not depend on the rules, so it is built once
+_SYSTEM_PROMPT = (
+    "You are an expert code reviewer with deep knowledge of software engineering best practices, "
+    "security vulnerabilities, performance optimization, and code maintainability. "
+    "Your role is to provide constructive, specific, and actionable feedback on code changes. "
+    "Focus on identifying real issues that could impact code quality, security, or maintainability. "
+    "Be concise but thorough in your analysis."
+)
+
+# Response format instructions appended to single-file and combined prompts
+_RESPONSE_FORMAT = '\n'.join([
+    "",
+    "**Response Format:**",
+    "Please provide your review in the following JSON format:",
+    "```json",
+    "{",
+    '  "issues": [',
+    '    {',
+    '      "rule": "security|performance|maintainability|style|documentation",',
+    '      "severity": "error|warning|info|suggestion",',
+    '      "line": <line_number_or_null>,',
+    '      "message": "Description of the issue",',
+    '      "suggestion": "How to fix it (optional)"',
+    '    }',
+    '  ],',
+    '  "summary": "Overall assessment of the changes"',
+    "}",
+    "```",
+])
+
+_BATCH_RESPONSE_FORMAT = '\n'.join([
+    "",
+    "**Response Format:**",
+    "Please provide your review in the following JSON format, with one entry per file name:",
+    "```json",
+    "{",
+    '  "files": {',
+    '    "<file name>": {',
+    '      "issues": [',
+    '        {',
+    '          "rule": "security|performance|maintainability|style|documentation",',
+    '          "severity": "error|warning|info|suggestion",',
+    '          "line": <line_number_or_null>,',
+    '          "message": "Description of the issue",',
+    '          "suggestion": "How to fix it (optional)"',
+    '        }',
+    '      ],',
+    '      "summary": "Overall assessment of the changes to this file"',
+    '    }',
+    '  }',
+    "}",
+    "```",
+])
+
 
 class ReviewEngine:
     """Core engine for performing AI-powered code reviews"""
@@ -31,28 +111,60 @@ class ReviewEngine:
             config: Configuration manager
         """
         self.config = config
-        self.bedrock_client = BedrockClient(config.get('bedrock'))
+        self.bedrock_client = BedrockClient(config.get('bedrock'), config.get('performance', {}))
         self.rule_processor = RuleProcessor(config)
         
         # Review configuration
         self.review_config = config.get('review', {})
         self.enabled_rules = self.review_config.get('enabled_rules', [])
         self.severity_threshold = self.review_config.get('severity_threshold', 'warning')
+        self._threshold_level = _SEVERITY_LEVELS.get(self.severity_threshold, 3)
         self.max_issues_per_file = self.review_config.get('max_issues_per_file', 10)
         self.batch_size = self.review_config.get('batch_size', 5)
+        self.combine_batches = self.review_config.get('combine_batches', False)
+        
+        # Prompt sections that only depend on configuration
+        guidelines = '\n'.join([
+            "- Focus only on the changed lines and their immediate context",
+            f"- Maximum {self.max_issues_per_file} issues per file",
+            f"- Only report issues with severity >= {self.severity_threshold}",
+            "- Provide specific, actionable feedback",
+            "- Consider the file type and context when applying rules"
+        ])
+        self._review_prompt_footer = '\n'.join([
+            _RESPONSE_FORMAT, "", "**Important Guidelines:**", guidelines
+        ])
+        self._batch_prompt_footer = '\n'.join([
+            _BATCH_RESPONSE_FORMAT, "", "**Important Guidelines:**",
+            "- Review each file only against its own criteria", guidelines
+        ])
         
         # Performance configuration
         self.perf_config = config.get('performance', {})
         self.parallel_processing = self.perf_config.get('parallel_processing', True)
         self.max_workers = self.perf_config.get('max_workers', 4)
+        
+        self._executor = None
+        
+        # Reviews of identical prompts (same diff, rules and settings) are replayed;
+        # at temperature 0 the client's response cache already covers this
+        self._review_cache = None
+        if self.perf_config.get('cache_enabled', False) and not self.bedrock_client.caches_responses:
+            self._review_cache = ResponseCache(
+                cache_dir=DEFAULT_CACHE_DIR.parent / 'reviews',
+                ttl=self.perf_config.get('cache_ttl', 3600)
+            )
     
     @log_performance
-    def review_changes(self, changes: Dict[str, FileChange]) -> ReviewResult:
+    def review_changes(self, changes: Dict[str, FileChange],
+                       on_file_reviewed: Optional[Callable[[FileReviewResult], None]] = None) -> ReviewResult:
         """
         Review all changed files
         
         Args:
             changes: Dictionary of filename -> FileChange
+            on_file_reviewed: Optional callback invoked with each file's result
+                as soon as it is available (always on the calling thread)
             
         Returns:
             ReviewResult with all review findings
@@ -63,10 +175,12 @@ class ReviewEngine:
             return self._create_empty_result()
         
         # Process files in parallel if enabled
-        if self.parallel_processing and len(changes) > 1:
-            file_results = self._review_files_parallel(changes)
+        if self.combine_batches and len(changes) > 1:
+            file_results = self._review_batches(changes, on_file_reviewed)
+        elif self.parallel_processing and len(changes) > 1:
+            file_results = self._review_files_parallel(changes, on_file_reviewed)
         else:
-            file_results = self._review_files_sequential(changes)
+            file_results = self._review_files_sequential(changes, on_file_reviewed)
         
         # Aggregate results
         result = self._aggregate_results(file_results)
@@ -74,65 +188,142 @@ class ReviewEngine:
         logger.info(f"Review completed: {result.total_issues} issues found across {result.total_files} files")
         return result
     
-    def _review_files_parallel(self, changes: Dict[str, FileChange]) -> Dict[str, FileReviewResult]:
-        """Review files in parallel"""
-        logger.debug(f"Processing {len(changes)} files in parallel with {self.max_workers} workers")
+    def _review_files_parallel(self, changes: Dict[str, FileChange],
+                               on_file_reviewed: Optional[Callable[[FileReviewResult], None]] = None
+                               ) -> Dict[str, FileReviewResult]:
+        """
+        Review files in parallel
         
-        file_results = {}
+        Each file is its own task: reviews are Bedrock round-trips that release
+        the GIL and share one thread-safe botocore client, so up to max_workers
+        requests are in flight at once. Results are reported in completion
+        order and returned in input order.
+        """
+        logger.debug(f"Processing {len(changes)} files in parallel with up to {self.max_workers} workers")
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit batches of files
-            futures = {}
-            
-            file_items = list(changes.items())
-            for i in range(0, len(file_items), self.batch_size):
-                batch = dict(file_items[i:i + self.batch_size])
-                future = executor.submit(self._review_file_batch, batch)
-                futures[future] = list(batch.keys())
-            
-            # Collect results
-            for future in as_completed(futures):
-                try:
-                    batch_results = future.result()
-                    file_results.update(batch_results)
-                except Exception as e:
-                    filenames = futures[future]
-                    logger.error(f"Failed to review batch {filenames}: {e}")
-                    # Create error results for failed files
-                    for filename in filenames:
-                        file_results[filename] = self._create_error_result(filename, str(e))
-        
-        return file_results
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._review_file_safely, filename, change): filename
+            for filename, change in changes.items()
+        }
+        
+        results = {}
+        for future in as_completed(futures):
+            result = results[futures[future]] = future.result()
+            if on_file_reviewed:
+                on_file_reviewed(result)
+        
+        return {filename: results[filename] for filename in changes}
     
-    def _review_files_sequential(self, changes: Dict[str, FileChange]) -> Dict[str, FileReviewResult]:
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the worker pool shared by all reviews from this engine
+        
+        Worker threads are started on demand up to max_workers and reused by
+        later calls; concurrent.futures joins them at interpreter exit.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='review')
+        return self._executor
+    
+    def _review_files_sequential(self, changes: Dict[str, FileChange],
+                                 on_file_reviewed: Optional[Callable[[FileReviewResult], None]] = None
+                                 ) -> Dict[str, FileReviewResult]:
         """Review files sequentially"""
         logger.debug(f"Processing {len(changes)} files sequentially")
         
+        results = {}
+        for filename, change in changes.items():
+            result = results[filename] = self._review_file_safely(filename, change)
+            if on_file_reviewed:
+                on_file_reviewed(result)
+        
+        return results
+    
+    def _review_batches(self, changes: Dict[str, FileChange],
+                        on_file_reviewed: Optional[Callable[[FileReviewResult], None]] = None
+                        ) -> Dict[str, FileReviewResult]:
+        """Review files in groups of batch_size, one model request per group"""
+        file_items = list(changes.items())
+        batches = [
+            file_items[i:i + self.batch_size]
+            for i in range(0, len(file_items), self.batch_size)
+        ]
+        logger.debug(f"Processing {len(changes)} files in {len(batches)} combined batches")
+        
+        if self.parallel_processing and len(batches) > 1:
+            executor = self._get_executor()
+            futures = [executor.submit(self._review_file_batch, batch) for batch in batches]
+            batch_results = (future.result() for future in as_completed(futures))
+        else:
+            batch_results = (self._review_file_batch(batch) for batch in batches)
+        
         file_results = {}
+        for results in batch_results:
+            file_results.update(results)
+            if on_file_reviewed:
+                for result in results.values():
+                    on_file_reviewed(result)
         
-        for filename, change in changes.items():
+        return {filename: file_results[filename] for filename in changes}
+    
+    def _review_file_batch(self, batch: List[Tuple[str, FileChange]]) -> Dict[str, FileReviewResult]:
+        """
+        Review a batch of files with a single model request
+        
+        Args:
+            batch: List of (filename, FileChange) pairs
+            
+        Returns:
+            Dictionary of filename -> FileReviewResult in batch order
+        """
+        results = {}
+        reviewable = {}
+        
+        for filename, change in batch:
+            if not self._has_reviewable_diff(filename, change):
+                results[filename] = self._create_empty_file_result(filename)
+                continue
+            
             try:
-                result = self._review_single_file(filename, change)
-                file_results[filename] = result
+                rules = self._get_file_rules(filename)
             except Exception as e:
                 logger.error(f"Failed to review {filename}: {e}")
-                file_results[filename] = self._create_error_result(filename, str(e))
-        
-        return file_results
-    
-    def _review_file_batch(self, batch: Dict[str, FileChange]) -> Dict[str, FileReviewResult]:
-        """Review a batch of files"""
-        results = {}
+                results[filename] = self._create_error_result(filename, str(e))
+                continue
+            
+            if rules:
+                reviewable[filename] = (change, rules)
+            else:
+                results[filename] = self._create_empty_file_result(filename)
         
-        for filename, change in batch.items():
+        if len(reviewable) == 1:
+            # Nothing to combine; use the regular single-file prompt
+            [(filename, (change, rules))] = reviewable.items()
             try:
-                result = self._review_single_file(filename, change)
-                results[filename] = result
+                results[filename] = self._review_file_with_rules(filename, change, rules)
             except Exception as e:
                 logger.error(f"Failed to review {filename}: {e}")
                 results[filename] = self._create_error_result(filename, str(e))
+        elif reviewable:
+            try:
+                prompt = self._build_batch_review_prompt(reviewable)
+                response = self.bedrock_client.invoke_model(prompt, self._build_system_prompt({}))
+                results.update(self._parse_batch_review_response(reviewable, response))
+            except Exception as e:
+                logger.error(f"Failed to review batch {list(reviewable)}: {e}")
+                for filename in reviewable:
+                    results[filename] = self._create_error_result(filename, str(e))
         
-        return results
+        return {filename: results[filename] for filename, _ in batch}
+    
+    def _review_file_safely(self, filename: str, change: FileChange) -> FileReviewResult:
+        """Review a single file, turning failures into an error result"""
+        try:
+            return self._review_single_file(filename, change)
+        except Exception as e:
+            logger.error(f"Failed to review {filename}: {e}")
+            return self._create_error_result(filename, str(e))
     
     def _review_single_file(self, filename: str, change: FileChange) -> FileReviewResult:
         """
@@ -147,26 +338,72 @@ class ReviewEngine:
         """
         logger.debug(f"Reviewing file: {filename}")
         
+        if not self._has_reviewable_diff(filename, change):
+            return self._create_empty_file_result(filename)
+        
+        rules = self._get_file_rules(filename)
+        if not rules:
+            return self._create_empty_file_result(filename)
+        
+        return self._review_file_with_rules(filename, change, rules)
+    
+    def _has_reviewable_diff(self, filename: str, change: FileChange) -> bool:
+        """Check whether a change has content worth sending to the model"""
+        if change.status == 'D':
+            logger.debug(f"Skipping {filename} (deleted)")
+            return False
+        
+        if not change.diff.strip():
+            logger.debug(f"Skipping {filename} (empty diff)")
+            return False
+        
+        return True
+    
+    def _get_file_rules(self, filename: str) -> Dict[str, Any]:
+        """
+        Get the processed rules that apply to a file
+        
+        Args:
+            filename: File path
+            
+        Returns:
+            Dictionary of rule name -> rule configuration (empty if none apply)
+        """
         # Get applicable rules for this file
         rule_templates = self.config.get_rule_templates(filename)
         if not rule_templates:
             logger.debug(f"No rule templates found for {filename}")
-            return self._create_empty_file_result(filename)
+            return {}
         
         # Load and process rules
         rules = self.rule_processor.load_rules_for_file(filename, rule_templates)
         if not rules:
             logger.debug(f"No applicable rules for {filename}")
-            return self._create_empty_file_result(filename)
+            return {}
         
+        return rules
+    
+    def _review_file_with_rules(self, filename: str, change: FileChange, rules: Dict[str, Any]) -> FileReviewResult:
+        """Review a single file against already resolved rules"""
         # Build review prompt
         prompt = self._build_review_prompt(filename, change, rules)
         system_prompt = self._build_system_prompt(rules)
         
+        cache_key = None
+        if self._review_cache is not None:
+            cache_key = self._review_cache_key(prompt, system_prompt)
+            cached = self._review_cache.get(cache_key)
+            if cached is not None:
+                result = self._file_result_from_cache(cached)
+                if result is not None:
+                    logger.debug(f"Using cached review for {filename}")
+                    return result
+                logger.debug(f"Ignoring malformed cached review for {filename}")
+        
         # Call Bedrock API
         try:
             response = self.bedrock_client.invoke_model(prompt, system_prompt)
-            return self._parse_review_response(filename, response, rules)
+            return self._parse_review_response(filename, response, rules, cache_key)
         except BedrockError as e:
             logger.error(f"Bedrock error reviewing {filename}: {e}")
             raise
@@ -174,6 +411,24 @@ class ReviewEngine:
             logger.error(f"Unexpected error reviewing {filename}: {e}")
             raise
     
+    def _review_cache_key(self, prompt: str, system_prompt: str) -> str:
+        """Build the review cache key; the prompt embeds the diff and rules, sampling settings are hashed too"""
+        client = self.bedrock_client
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(f"{_REVIEW_CACHE_VERSION}\0{client.model_id}\0{system_prompt}\0{prompt}".encode('utf-8'))
+        digest.update(struct.pack('<Id', client.max_tokens, client.temperature))
+        return digest.hexdigest()
+    
+    def _file_result_from_cache(self, data: Dict[str, Any]) -> Optional[FileReviewResult]:
+        """Rebuild a cached FileReviewResult; replayed reviews cost nothing, malformed entries return None"""
+        try:
+            data = dict(data)
+            data['issues'] = [ReviewIssue(**issue) for issue in data['issues']]
+            data['cost_estimate'] = 0.0
+            return FileReviewResult(**data)
+        except (KeyError, TypeError, ValueError):
+            return None
+    
     def _build_review_prompt(self, filename: str, change: FileChange, rules: Dict[str, Any]) -> str:
         """Build review prompt for a file"""
         prompt_parts = [
@@ -198,125 +453,76 @@ class ReviewEngine:
                 prompt_parts.append(f"\n**{rule_name.upper()}:**")
                 prompt_parts.append(rule_config.get('prompt', ''))
         
-        prompt_parts.extend([
-            "",
-            "**Response Format:**",
-            "Please provide your review in the following JSON format:",
-            "```json",
-            "{",
-            '  "issues": [',
-            '    {',
-            '      "rule": "security|performance|maintainability|style|documentation",',
-            '      "severity": "error|warning|info|suggestion",',
-            '      "line": <line_number_or_null>,',
-            '      "message": "Description of the issue",',
-            '      "suggestion": "How to fix it (optional)"',
-            '    }',
-            '  ],',
-            '  "summary": "Overall assessment of the changes"',
-            "}",
-            "```",
-            "",
-            "**Important Guidelines:**",
-            f"- Focus only on the changed lines and their immediate context",
-            f"- Maximum {self.max_issues_per_file} issues per file",
-            f"- Only report issues with severity >= {self.severity_threshold}",
-            f"- Provide specific, actionable feedback",
-            f"- Consider the file type and context when applying rules"
-        ])
+        # Static response format and guidelines are rendered once in __init__
+        prompt_parts.append(self._review_prompt_footer)
+        
+        return '\n'.join(prompt_parts)
+    
+    def _build_batch_review_prompt(self, batch: Dict[str, Any]) -> str:
+        """
+        Build one review prompt covering several files
+        
+        Args:
+            batch: Dictionary of filename -> (FileChange, rules)
+            
+        Returns:
+            Prompt asking for a JSON review keyed by filename
+        """
+        prompt_parts = [
+            "Please review the following code changes and provide feedback according to the specified rules.",
+            "Each file is enclosed in <file> tags and lists the review criteria that apply to it.",
+        ]
+        
+        for filename, (change, rules) in batch.items():
+            prompt_parts.extend([
+                "",
+                f'<file name="{filename}">',
+                f"**Change Type:** {self._get_change_type_description(change.status)}",
+                f"**Lines Added:** {change.lines_added}",
+                f"**Lines Removed:** {change.lines_removed}",
+                "",
+                "**Code Changes:**",
+                "```diff",
+                change.diff,
+                "```",
+                "",
+                "**Review Criteria:**"
+            ])
+            
+            for rule_name, rule_config in rules.items():
+                if rule_config.get('enabled', True):
+                    prompt_parts.append(f"\n**{rule_name.upper()}:**")
+                    prompt_parts.append(rule_config.get('prompt', ''))
+            
+            prompt_parts.append("</file>")
+        
+        prompt_parts.append(self._batch_prompt_footer)
         
         return '\n'.join(prompt_parts)
     
     def _build_system_prompt(self, rules: Dict[str, Any]) -> str:
         """Build system prompt for the review"""
-        return (
-            "You are an expert code reviewer with deep knowledge of software engineering best practices, "
-            "security vulnerabilities, performance optimization, and code maintainability. "
-            "Your role is to provide constructive, specific, and actionable feedback on code changes. "
-            "Focus on identifying real issues that could impact code quality, security, or maintainability. "
-            "Be concise but thorough in your analysis."
-        )
+        return _SYSTEM_PROMPT
     
     def _get_change_type_description(self, status: str) -> str:
         """Get human-readable description of change type"""
-        descriptions = {
-            'A': 'Added (new file)',
-            'M': 'Modified (existing file)',
-            'D': 'Deleted (removed file)',
-            'R': 'Renamed (moved file)',
-            'C': 'Copied (duplicated file)'
-        }
-        return descriptions.get(status, f'Unknown ({status})')
+        return _CHANGE_TYPE_DESCRIPTIONS.get(status, f'Unknown ({status})')
     
-    def _parse_review_response(self, filename: str, response: BedrockResponse, rules: Dict[str, Any]) -> FileReviewResult:
-        """Parse Bedrock response into FileReviewResult"""
+    def _parse_review_response(self, filename: str, response: BedrockResponse, rules: Dict[str, Any],
+                               cache_key: Optional[str] = None) -> FileReviewResult:
+        """Parse Bedrock response into FileReviewResult, caching it under cache_key if parsed"""
         try:
-            # Extract JSON from response
-            content = response.content.strip()
-            
-            # Find JSON block
-            json_start = content.find('{')
-            json_end = content.rfind('}') + 1
-            
-            if json_start == -1 or json_end == 0:
-                raise ValidationError("No JSON found in response")
-            
-            json_content = content[json_start:json_end]
-            parsed_response = json.loads(json_content)
-            
-            # Validate response structure
-            if 'issues' not in parsed_response:
-                raise ValidationError("Response missing 'issues' field")
-            
-            # Parse issues
-            issues = []
-            for issue_data in parsed_response.get('issues', []):
-                try:
-                    issue = ReviewIssue(
-                        rule=issue_data.get('rule', 'unknown'),
-                        severity=issue_data.get('severity', 'info'),
-                        line=issue_data.get('line'),
-                        message=issue_data.get('message', ''),
-                        suggestion=issue_data.get('suggestion'),
-                        file_path=filename
-                    )
-                    
-                    # Validate severity
-                    if issue.severity not in ['error', 'warning', 'info', 'suggestion']:
-                        issue.severity = 'info'
-                    
-                    # Filter by severity threshold
-                    if self._meets_severity_threshold(issue.severity):
-                        issues.append(issue)
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to parse issue in {filename}: {e}")
-                    continue
-            
-            # Limit number of issues
-            if len(issues) > self.max_issues_per_file:
-                logger.warning(f"Limiting {filename} to {self.max_issues_per_file} issues (found {len(issues)})")
-                issues = issues[:self.max_issues_per_file]
-            
-            # Count issues by severity
-            error_count = sum(1 for issue in issues if issue.severity == 'error')
-            warning_count = sum(1 for issue in issues if issue.severity == 'warning')
-            info_count = sum(1 for issue in issues if issue.severity == 'info')
-            suggestion_count = sum(1 for issue in issues if issue.severity == 'suggestion')
-            
-            return FileReviewResult(
-                filename=filename,
-                issues=issues,
-                summary=parsed_response.get('summary', 'No summary provided'),
-                total_issues=len(issues),
-                error_count=error_count,
-                warning_count=warning_count,
-                info_count=info_count,
-                suggestion_count=suggestion_count,
-                tokens_used=response.input_tokens + response.output_tokens,
-                cost_estimate=response.cost_estimate
+            parsed_response = self._extract_json(response.content)
+            result = self._build_file_result(
+                filename, parsed_response,
+                response.input_tokens + response.output_tokens,
+                response.cost_estimate
             )
             
+            if cache_key is not None:
+                self._review_cache.set(cache_key, asdict(result))
+            return result
+            
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response for {filename}: {e}")
             return self._create_error_result(filename, f"Invalid JSON response: {e}")
@@ -327,12 +533,156 @@ class ReviewEngine:
             logger.error(f"Unexpected error parsing response for {filename}: {e}")
             return self._create_error_result(filename, f"Parsing error: {e}")
     
+    def _parse_batch_review_response(self, batch: Dict[str, Any], response: BedrockResponse) -> Dict[str, FileReviewResult]:
+        """
+        Split a combined Bedrock response into per-file results
+        
+        Token usage and cost are shared evenly between the files in the batch.
+        
+        Args:
+            batch: Dictionary of filename -> (FileChange, rules)
+            response: Response to the combined prompt
+            
+        Returns:
+            Dictionary of filename -> FileReviewResult
+        """
+        try:
+            parsed_response = self._extract_json(response.content)
+            files = parsed_response.get('files')
+            if not isinstance(files, dict):
+                raise ValidationError("Response missing 'files' field")
+        except (json.JSONDecodeError, ValidationError) as e:
+            logger.error(f"Invalid combined response for {list(batch)}: {e}")
+            return {
+                filename: self._create_error_result(filename, f"Invalid response format: {e}")
+                for filename in batch
+            }
+        
+        file_count = len(batch)
+        tokens_share, tokens_remainder = divmod(response.input_tokens + response.output_tokens, file_count)
+        cost_share = response.cost_estimate / file_count
+        
+        results = {}
+        for index, filename in enumerate(batch):
+            file_response = files.get(filename)
+            if not isinstance(file_response, dict):
+                logger.error(f"Combined response has no review for {filename}")
+                results[filename] = self._create_error_result(filename, "Response missing review for file")
+                continue
+            
+            try:
+                results[filename] = self._build_file_result(
+                    filename, file_response,
+                    tokens_share + (tokens_remainder if index == 0 else 0),
+                    cost_share
+                )
+            except ValidationError as e:
+                logger.error(f"Invalid response format for {filename}: {e}")
+                results[filename] = self._create_error_result(filename, f"Invalid response format: {e}")
+        
+        return results
+    
+    def _extract_json(self, content: str) -> Dict[str, Any]:
+        """
+        Extract the JSON object from a model response
+        
+        Args:
+            content: Response text
+            
+        Returns:
+            Parsed JSON object
+            
+        Raises:
+            ValidationError: If the response contains no JSON object
+            json.JSONDecodeError: If the JSON is malformed
+        """
+        content = content.strip()
+        
+        # Find JSON block
+        json_start = content.find('{')
+        json_end = content.rfind('}') + 1
+        
+        if json_start == -1 or json_end == 0:
+            raise ValidationError("No JSON found in response")
+        
+        # orjson's JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+        try:
+            return _json_loads(content[json_start:json_end])
+        except json.JSONDecodeError:
+            # Text after the object may contain '}'; decode only the first complete object
+            return _JSON_DECODER.raw_decode(content, json_start)[0]
+    
+    def _build_file_result(self, filename: str, parsed_response: Dict[str, Any],
+                           tokens_used: int, cost_estimate: float) -> FileReviewResult:
+        """
+        Build a FileReviewResult from one file's parsed review
+        
+        Args:
+            filename: File path
+            parsed_response: Parsed review with 'issues' and 'summary'
+            tokens_used: Tokens attributed to this file
+            cost_estimate: Cost attributed to this file
+            
+        Returns:
+            FileReviewResult
+            
+        Raises:
+            ValidationError: If the review has no 'issues' field
+        """
+        # Validate response structure
+        if 'issues' not in parsed_response:
+            raise ValidationError("Response missing 'issues' field")
+        
+        # Parse issues
+        issues = []
+        for issue_data in parsed_response.get('issues', []):
+            try:
+                # Validate severity
+                severity = issue_data.get('severity', 'info')
+                if severity not in _SEVERITY_LEVELS:
+                    severity = 'info'
+                
+                # Filter by severity threshold before building the issue
+                if not self._meets_severity_threshold(severity):
+                    continue
+                
+                issues.append(ReviewIssue(
+                    rule=issue_data.get('rule', 'unknown'),
+                    severity=severity,
+                    line=issue_data.get('line'),
+                    message=issue_data.get('message', ''),
+                    suggestion=issue_data.get('suggestion'),
+                    file_path=filename
+                ))
+                    
+            except Exception as e:
+                logger.warning(f"Failed to parse issue in {filename}: {e}")
+                continue
+        
+        # Limit number of issues
+        if len(issues) > self.max_issues_per_file:
+            logger.warning(f"Limiting {filename} to {self.max_issues_per_file} issues (found {len(issues)})")
+            issues = issues[:self.max_issues_per_file]
+        
+        # Count issues by severity
+        severity_counts = Counter(issue.severity for issue in issues)
+        
+        return FileReviewResult(
+            filename=filename,
+            issues=issues,
+            summary=parsed_response.get('summary', 'No summary provided'),
+            total_issues=len(issues),
+            error_count=severity_counts['error'],
+            warning_count=severity_counts['warning'],
+            info_count=severity_counts['info'],
+            suggestion_count=severity_counts['suggestion'],
+            tokens_used=tokens_used,
+            cost_estimate=cost_estimate
+        )
+    
     def _meets_severity_threshold(self, severity: str) -> bool:
         """Check if severity meets the configured threshold"""
-        severity_levels = {'suggestion': 1, 'info': 2, 'warning': 3, 'error': 4}
-        threshold_level = severity_levels.get(self.severity_threshold, 3)
-        issue_level = severity_levels.get(severity, 2)
-        return issue_level >= threshold_level
+        return _SEVERITY_LEVELS.get(severity, 2) >= self._threshold_level
     
     def _create_empty_result(self) -> ReviewResult:
         """Create empty review result"""
@@ -390,13 +740,17 @@ class ReviewEngine:
     def _aggregate_results(self, file_results: Dict[str, FileReviewResult]) -> ReviewResult:
         """Aggregate file results into overall result"""
         total_files = len(file_results)
-        total_issues = sum(result.total_issues for result in file_results.values())
-        total_errors = sum(result.error_count for result in file_results.values())
-        total_warnings = sum(result.warning_count for result in file_results.values())
-        total_info = sum(result.info_count for result in file_results.values())
-        total_suggestions = sum(result.suggestion_count for result in file_results.values())
-        total_tokens = sum(result.tokens_used for result in file_results.values())
-        total_cost = sum(result.cost_estimate for result in file_results.values())
+        total_issues = total_errors = total_warnings = total_info = total_suggestions = total_tokens = 0
+        total_cost = 0.0
+        
+        for result in file_results.values():
+            total_issues += result.total_issues
+            total_errors += result.error_count
+            total_warnings += result.warning_count
+            total_info += result.info_count
+            total_suggestions += result.suggestion_count
+            total_tokens += result.tokens_used
+            total_cost += result.cost_estimate
         
         # Generate overall summary
         if total_issues == 0:
@@ -2,6 +2,7 @@
 Result formatter for AI Code Review
 """
 
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from dataclasses import asdict
 import json
@@ -11,6 +12,46 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+
+def _dump_json(result: ReviewResult) -> bytes:
+    """Serialize a review result to indented UTF-8 JSON; shared by display and export"""
+    if orjson is not None:
+        # orjson serializes dataclasses natively, without an asdict() copy
+        return orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2)
+    
+    # Convert dataclasses to dictionaries
+    return json.dumps(asdict(result), indent=2, default=str).encode('utf-8')
+
+
+# ANSI SGR color parameters
+_ANSI_COLOR_CODES = {
+    'red': '91',
+    'green': '92',
+    'yellow': '93',
+    'blue': '94',
+    'magenta': '95',
+    'cyan': '96',
+    'white': '97'
+}
+
+# Escape sequences per color; bold is merged into the same sequence ("1;91")
+_ANSI_COLORS = {name: f'\033[{code}m' for name, code in _ANSI_COLOR_CODES.items()}
+_ANSI_BOLD_COLORS = {name: f'\033[1;{code}m' for name, code in _ANSI_COLOR_CODES.items()}
+_ANSI_RESET = '\033[0m'
+
+# Severity icon and color
+_SEVERITY_STYLES = {
+    'error': ('❌', 'red'),
+    'warning': ('⚠️', 'yellow'),
+    'info': ('ℹ️', 'blue'),
+    'suggestion': ('💡', 'green')
+}
+
 
 class ResultFormatter:
     """Formats review results for display and output"""
@@ -82,7 +123,7 @@ class ResultFormatter:
             # Issues
             for issue in file_result.issues:
                 if displayed_issues >= self.max_display_issues:
-                    remaining = sum(fr.total_issues for fr in result.files.values()) - displayed_issues
+                    remaining = result.total_issues - displayed_issues
                     lines.append(f"... and {remaining} more issues (use --all to see all)")
                     break
                 
@@ -101,9 +142,7 @@ class ResultFormatter:
     
     def _format_json(self, result: ReviewResult) -> str:
         """Format as JSON"""
-        # Convert dataclasses to dictionaries
-        result_dict = asdict(result)
-        return json.dumps(result_dict, indent=2, default=str)
+        return _dump_json(result).decode('utf-8')
     
     def _format_markdown(self, result: ReviewResult) -> str:
         """Format as Markdown"""
@@ -219,15 +258,7 @@ class ResultFormatter:
     
     def _format_issue(self, issue: ReviewIssue) -> str:
         """Format a single issue"""
-        # Severity icon and color
-        severity_info = {
-            'error': ('❌', 'red'),
-            'warning': ('⚠️', 'yellow'),
-            'info': ('ℹ️', 'blue'),
-            'suggestion': ('💡', 'green')
-        }
-        
-        icon, color = severity_info.get(issue.severity, ('•', 'white'))
+        icon, color = _SEVERITY_STYLES.get(issue.severity, ('•', 'white'))
         
         # Build issue line
         parts = [icon]
@@ -273,25 +304,8 @@ class ResultFormatter:
         if not self.color_output:
             return text
         
-        # ANSI color codes
-        colors = {
-            'red': '\033[91m',
-            'green': '\033[92m',
-            'yellow': '\033[93m',
-            'blue': '\033[94m',
-            'magenta': '\033[95m',
-            'cyan': '\033[96m',
-            'white': '\033[97m',
-            'reset': '\033[0m'
-        }
-        
-        color_code = colors.get(color, colors['white'])
-        reset_code = colors['reset']
-        
-        if bold:
-            color_code = f'\033[1m{color_code}'
-        
-        return f"{color_code}{text}{reset_code}"
+        colors = _ANSI_BOLD_COLORS if bold else _ANSI_COLORS
+        return f"{colors.get(color, colors['white'])}{text}{_ANSI_RESET}"
     
     def format_summary_only(self, result: ReviewResult) -> str:
         """Format summary-only output"""
@@ -338,10 +352,15 @@ class ResultFormatter:
             True if export successful
         """
         try:
-            content = self.format_review_result(result, format_type)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            if format_type == 'json':
+                # Write the UTF-8 JSON as-is rather than decoding and re-encoding it
+                with open(output_path, 'wb') as f:
+                    f.write(_dump_json(result))
+            else:
+                content = self.format_review_result(result, format_type)
+                
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
             
             logger.info(f"Exported results to {output_path}")
             return True
@@ -361,13 +380,11 @@ class ResultFormatter:
     
     def get_issue_counts_by_rule(self, result: ReviewResult) -> Dict[str, int]:
         """Get issue counts grouped by rule"""
-        rule_counts = {}
-        
-        for file_result in result.files.values():
-            for issue in file_result.issues:
-                rule_counts[issue.rule] = rule_counts.get(issue.rule, 0) + 1
-        
-        return rule_counts
+        return dict(Counter(
+            issue.rule
+            for file_result in result.files.values()
+            for issue in file_result.issues
+        ))
     
     def get_files_with_issues(self, result: ReviewResult) -> List[str]:
         """Get list of files that have issues"""
@@ -5,8 +5,10 @@ Data models for AI Code Review
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 
+from ..utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ReviewIssue:
     """Represents a code review issue"""
     rule: str
@@ -17,7 +19,7 @@ class ReviewIssue:
     file_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FileReviewResult:
     """Result of reviewing a single file"""
     filename: str
@@ -32,7 +34,7 @@ class FileReviewResult:
     cost_estimate: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReviewResult:
     """Complete review result"""
     files: Dict[str, FileReviewResult]
@@ -3,6 +3,9 @@ Rule processor for AI Code Review
 """
 
 import yaml
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import fnmatch
@@ -10,9 +13,30 @@ import fnmatch
 from ..utils.exceptions import ConfigurationError
 from ..utils.logging import get_logger
 
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _compile_override_pattern(pattern: str) -> re.Pattern:
+    """Compile a file_overrides glob with the same semantics as fnmatch.fnmatch"""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def _template_dirs() -> tuple:
+    """Rule template search directories, in precedence order"""
+    return (
+        Path(__file__).parent.parent / 'config' / 'templates',
+        Path.cwd() / '.ai-code-review' / 'templates',
+        Path.home() / '.ai-code-review' / 'templates',
+    )
+
+
 class RuleProcessor:
     """Processes and manages code review rules"""
     
@@ -25,10 +49,16 @@ class RuleProcessor:
         """
         self.config = config
         self.review_config = config.get('review', {})
-        self.enabled_rules = self.review_config.get('enabled_rules', [])
+        self.enabled_rules = frozenset(self.review_config.get('enabled_rules', []))
         
         # Cache for loaded rule templates
         self._template_cache = {}
+        
+        # Cache of merged, enabled rules per template list (before file overrides)
+        self._rules_cache = {}
+        
+        # Template name -> template files in precedence order, built on first use
+        self._template_paths = None
     
     def load_rules_for_file(self, filename: str, template_names: List[str]) -> Dict[str, Any]:
         """
@@ -39,10 +69,37 @@ class RuleProcessor:
             template_names: List of rule template names to load
             
         Returns:
-            Dictionary of rule_name -> rule_config
+            Dictionary of rule_name -> rule_config; rule configs no file
+            override applied to are shared between calls and must not be modified
         """
         logger.debug(f"Loading rules for {filename} using templates: {template_names}")
         
+        base_rules = self._get_enabled_rules(tuple(template_names))
+        
+        # Apply file-specific overrides if they exist
+        filtered_rules = {}
+        for rule_name, rule_config in base_rules.items():
+            if 'file_overrides' in rule_config:
+                rule_config = self._apply_file_overrides(rule_config, filename)
+            filtered_rules[rule_name] = rule_config
+        
+        logger.debug(f"Loaded {len(filtered_rules)} rules for {filename}")
+        return filtered_rules
+    
+    def _get_enabled_rules(self, template_names: tuple) -> Dict[str, Any]:
+        """
+        Merge templates and keep only enabled rules, caching per template list
+        
+        Args:
+            template_names: Rule template names, later ones taking precedence
+            
+        Returns:
+            Dictionary of rule_name -> rule_config
+        """
+        cached = self._rules_cache.get(template_names)
+        if cached is not None:
+            return cached
+        
         all_rules = {}
         
         # Load each template
@@ -57,14 +114,13 @@ class RuleProcessor:
                 continue
         
         # Filter by enabled rules
-        filtered_rules = {}
-        for rule_name, rule_config in all_rules.items():
-            if rule_name in self.enabled_rules:
-                # Apply file-specific overrides if they exist
-                final_config = self._apply_file_overrides(rule_config, filename)
-                filtered_rules[rule_name] = final_config
+        filtered_rules = {
+            rule_name: rule_config
+            for rule_name, rule_config in all_rules.items()
+            if rule_name in self.enabled_rules
+        }
         
-        logger.debug(f"Loaded {len(filtered_rules)} rules for {filename}")
+        self._rules_cache[template_names] = filtered_rules
         return filtered_rules
     
     def _load_rule_template(self, template_name: str) -> Dict[str, Any]:
@@ -82,23 +138,16 @@ class RuleProcessor:
             return self._template_cache[template_name]
         
         # Try to find template file
-        template_paths = [
-            Path(__file__).parent.parent / 'config' / 'templates' / f'{template_name}.yaml',
-            Path.cwd() / '.ai-code-review' / 'templates' / f'{template_name}.yaml',
-            Path.home() / '.ai-code-review' / 'templates' / f'{template_name}.yaml',
-        ]
-        
         template_data = None
-        for template_path in template_paths:
-            if template_path.exists():
-                try:
-                    with open(template_path, 'r', encoding='utf-8') as f:
-                        template_data = yaml.safe_load(f)
-                    logger.debug(f"Loaded template {template_name} from {template_path}")
-                    break
-                except Exception as e:
-                    logger.warning(f"Failed to load template from {template_path}: {e}")
-                    continue
+        for template_path in self._get_template_paths().get(template_name, []):
+            try:
+                with open(template_path, 'r', encoding='utf-8') as f:
+                    template_data = yaml.load(f, Loader=_SafeLoader)
+                logger.debug(f"Loaded template {template_name} from {template_path}")
+                break
+            except Exception as e:
+                logger.warning(f"Failed to load template from {template_path}: {e}")
+                continue
         
         if template_data is None:
             logger.warning(f"Template {template_name} not found in any location")
@@ -112,6 +161,30 @@ class RuleProcessor:
         
         return rules
     
+    def _get_template_paths(self) -> Dict[str, List[Path]]:
+        """
+        Index the template files in all search directories
+        
+        Each directory is listed once with os.scandir instead of probing
+        every candidate path with a stat call.
+        
+        Returns:
+            Dictionary of template name -> template paths in precedence order
+        """
+        if self._template_paths is None:
+            template_paths = {}
+            for template_dir in _template_dirs():
+                try:
+                    with os.scandir(template_dir) as entries:
+                        for entry in entries:
+                            if entry.name.endswith('.yaml') and entry.is_file():
+                                template_paths.setdefault(entry.name[:-5], []).append(Path(entry.path))
+                except OSError:
+                    continue
+            self._template_paths = template_paths
+        
+        return self._template_paths
+    
     def _apply_file_overrides(self, rule_config: Dict[str, Any], filename: str) -> Dict[str, Any]:
         """
         Apply file-specific rule overrides
@@ -121,17 +194,24 @@ class RuleProcessor:
             filename: File path
             
         Returns:
-            Rule configuration with overrides applied
+            Rule configuration with overrides applied; the original
+            configuration itself if no override matches
         """
-        # Make a copy to avoid modifying the original
-        final_config = rule_config.copy()
+        final_config = rule_config
         
         # Check for file-specific overrides in the rule config
         file_overrides = rule_config.get('file_overrides', {})
         
+        # fnmatch.fnmatch normalizes both sides; do it once for the file name
+        normalized_filename = os.path.normcase(filename)
+        
         for pattern, overrides in file_overrides.items():
-            if fnmatch.fnmatch(filename, pattern):
+            if _compile_override_pattern(pattern).match(normalized_filename):
                 logger.debug(f"Applying file override for pattern {pattern} to {filename}")
+                
+                # Copy on first match to avoid modifying the original
+                if final_config is rule_config:
+                    final_config = rule_config.copy()
                 final_config.update(overrides)
         
         return final_config
@@ -263,13 +343,15 @@ class RuleProcessor:
         template_path = template_dir / f'{template_name}.yaml'
         try:
             with open(template_path, 'w', encoding='utf-8') as f:
-                yaml.dump(template_data, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(template_data, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
             
             logger.info(f"Created rule template: {template_path}")
             
             # Clear cache to force reload
             if template_name in self._template_cache:
                 del self._template_cache[template_name]
+            self._rules_cache.clear()
+            self._template_paths = None
             
             return True
             
@@ -284,22 +366,7 @@ class RuleProcessor:
         Returns:
             List of template names
         """
-        templates = set()
-        
-        # Check all possible template locations
-        template_dirs = [
-            Path(__file__).parent.parent / 'config' / 'templates',
-            Path.cwd() / '.ai-code-review' / 'templates',
-            Path.home() / '.ai-code-review' / 'templates',
-        ]
-        
-        for template_dir in template_dirs:
-            if template_dir.exists():
-                for template_file in template_dir.glob('*.yaml'):
-                    template_name = template_file.stem
-                    templates.add(template_name)
-        
-        return sorted(list(templates))
+        return sorted(self._get_template_paths())
     
     def get_template_info(self, template_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -311,37 +378,32 @@ class RuleProcessor:
         Returns:
             Template metadata or None if not found
         """
-        template_paths = [
-            Path(__file__).parent.parent / 'config' / 'templates' / f'{template_name}.yaml',
-            Path.cwd() / '.ai-code-review' / 'templates' / f'{template_name}.yaml',
-            Path.home() / '.ai-code-review' / 'templates' / f'{template_name}.yaml',
-        ]
-        
-        for template_path in template_paths:
-            if template_path.exists():
-                try:
-                    with open(template_path, 'r', encoding='utf-8') as f:
-                        template_data = yaml.safe_load(f)
-                    
-                    # Extract metadata
-                    info = {
-                        'name': template_data.get('name', template_name),
-                        'description': template_data.get('description', ''),
-                        'version': template_data.get('version', '1.0.0'),
-                        'file_patterns': template_data.get('file_patterns', []),
-                        'rules': list(template_data.get('rules', {}).keys()),
-                        'path': str(template_path)
-                    }
-                    
-                    return info
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to read template info from {template_path}: {e}")
-                    continue
+        for template_path in self._get_template_paths().get(template_name, []):
+            try:
+                with open(template_path, 'r', encoding='utf-8') as f:
+                    template_data = yaml.load(f, Loader=_SafeLoader)
+                
+                # Extract metadata
+                info = {
+                    'name': template_data.get('name', template_name),
+                    'description': template_data.get('description', ''),
+                    'version': template_data.get('version', '1.0.0'),
+                    'file_patterns': template_data.get('file_patterns', []),
+                    'rules': list(template_data.get('rules', {}).keys()),
+                    'path': str(template_path)
+                }
+                
+                return info
+                
+            except Exception as e:
+                logger.warning(f"Failed to read template info from {template_path}: {e}")
+                continue
         
         return None
     
     def clear_template_cache(self) -> None:
         """Clear the template cache"""
         self._template_cache.clear()
+        self._rules_cache.clear()
+        self._template_paths = None
         logger.debug("Cleared rule template cache")
\ No newline at end of file
@@ -5,21 +5,32 @@ Interactive user interface for AI Code Review
 import sys
 import time
 from typing import Optional, List, Dict, Any
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.console import Console, Group
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
-from rich.live import Live
 
 from ..review.engine import ReviewResult, FileReviewResult
 from ..review.formatter import ResultFormatter
 from ..utils.exceptions import UserAbortError
-from ..utils.logging import get_logger
+from ..utils.logging import get_logger, is_stdout_tty
 
 logger = get_logger(__name__)
 
+# Severity style and icon for detailed issue output
+_SEVERITY_STYLES = {
+    'error': 'red',
+    'warning': 'yellow',
+    'info': 'blue',
+    'suggestion': 'green'
+}
+_SEVERITY_ICONS = {
+    'error': '❌',
+    'warning': '⚠️',
+    'info': 'ℹ️',
+    'suggestion': '💡'
+}
+
 
 class InteractiveUI:
     """Interactive user interface for code review workflow"""
@@ -38,11 +49,15 @@ class InteractiveUI:
         self.interactive_mode = self.ui_config.get('interactive_mode', True)
         self.color_output = self.ui_config.get('color_output', True)
         self.show_progress = self.ui_config.get('show_progress', True)
+        self.max_display_issues = self.ui_config.get('max_display_issues', 20)
+        
+        # Prompts read from stdin; in a pre-push hook it carries the pushed refs
+        self._stdin_is_tty = sys.stdin is not None and sys.stdin.isatty()
         
         # Initialize Rich console
         self.console = Console(
             color_system="auto" if self.color_output else None,
-            force_terminal=True if sys.stdout.isatty() else False
+            force_terminal=is_stdout_tty()
         )
         
         # Result formatter
@@ -81,6 +96,8 @@ class InteractiveUI:
             self.console.print(f"⏳ {message}...")
             return None
         
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -101,6 +118,8 @@ class InteractiveUI:
         if not self.show_progress or total_files <= 1:
             return None
         
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+        
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -117,8 +136,8 @@ class InteractiveUI:
         Args:
             result: ReviewResult to display
         """
-        if not self.interactive_mode:
-            # Non-interactive mode: just print formatted results
+        if not self.interactive_mode or not self._stdin_is_tty:
+            # Non-interactive mode (or nobody to answer prompts): just print formatted results
             formatted_output = self.formatter.format_review_result(result, 'terminal')
             self.console.print(formatted_output)
             return
@@ -154,6 +173,8 @@ class InteractiveUI:
     
     def _display_summary_panel(self, result: ReviewResult) -> None:
         """Display summary panel"""
+        from rich.table import Table
+        
         # Create summary table
         table = Table(show_header=False, box=None, padding=(0, 1))
         table.add_column("Metric", style="bold")
@@ -248,12 +269,10 @@ class InteractiveUI:
     
     def _display_detailed_results(self, result: ReviewResult) -> None:
         """Display detailed issue results"""
-        self.console.print("[bold]📋 Detailed Issues[/bold]")
-        self.console.print()
+        # Collect everything and print it with a single console call
+        renderables = ["[bold]📋 Detailed Issues[/bold]", ""]
         
         issue_count = 0
-        max_display = self.ui_config.get('max_display_issues', 20)
-        
         for filename, file_result in result.files.items():
             if file_result.total_issues == 0:
                 continue
@@ -275,43 +294,35 @@ class InteractiveUI:
                 
                 file_header.append(f" ({' '.join(counts)})")
             
-            self.console.print(file_header)
+            renderables.append(file_header)
             
             # File summary
             if file_result.summary:
-                self.console.print(f"   [dim]{file_result.summary}[/dim]")
+                renderables.append(f"   [dim]{file_result.summary}[/dim]")
             
             # Issues
+            truncated = False
             for issue in file_result.issues:
-                if issue_count >= max_display:
-                    remaining = sum(fr.total_issues for fr in result.files.values()) - issue_count
-                    self.console.print(f"   [dim]... and {remaining} more issues[/dim]")
-                    return
+                if issue_count >= self.max_display_issues:
+                    remaining = result.total_issues - issue_count
+                    renderables.append(f"   [dim]... and {remaining} more issues[/dim]")
+                    truncated = True
+                    break
                 
-                self._display_single_issue(issue)
+                renderables.extend(self._render_single_issue(issue))
                 issue_count += 1
             
-            self.console.print()
+            if truncated:
+                break
+            
+            renderables.append("")
+        
+        self.console.print(Group(*renderables))
     
-    def _display_single_issue(self, issue) -> None:
-        """Display a single issue"""
-        # Severity styling
-        severity_styles = {
-            'error': 'red',
-            'warning': 'yellow',
-            'info': 'blue',
-            'suggestion': 'green'
-        }
-        
-        severity_icons = {
-            'error': '❌',
-            'warning': '⚠️',
-            'info': 'ℹ️',
-            'suggestion': '💡'
-        }
-        
-        style = severity_styles.get(issue.severity, 'white')
-        icon = severity_icons.get(issue.severity, '•')
+    def _render_single_issue(self, issue) -> List[Text]:
+        """Render a single issue and its suggestion, if any"""
+        style = _SEVERITY_STYLES.get(issue.severity, 'white')
+        icon = _SEVERITY_ICONS.get(issue.severity, '•')
         
         # Issue line
         issue_text = Text()
@@ -323,7 +334,7 @@ class InteractiveUI:
         issue_text.append(f"[{issue.rule.upper()}] ", style="bold")
         issue_text.append(issue.message)
         
-        self.console.print(issue_text)
+        lines = [issue_text]
         
         # Suggestion
         if issue.suggestion:
@@ -331,7 +342,9 @@ class InteractiveUI:
             suggestion_text.append("      💡 ", style="cyan")
             suggestion_text.append("Suggestion: ", style="cyan bold")
             suggestion_text.append(issue.suggestion, style="cyan")
-            self.console.print(suggestion_text)
+            lines.append(suggestion_text)
+        
+        return lines
     
     def _display_files_with_issues(self, result: ReviewResult) -> None:
         """Display list of files with issues"""
@@ -344,8 +357,7 @@ class InteractiveUI:
             self.console.print("[green]No files have issues![/green]")
             return
         
-        self.console.print(f"[bold]📁 Files with Issues ({len(files_with_issues)})[/bold]")
-        self.console.print()
+        from rich.table import Table
         
         # Create table
         table = Table(show_header=True, header_style="bold magenta")
@@ -366,8 +378,13 @@ class InteractiveUI:
                 str(file_result.total_issues)
             )
         
-        self.console.print(table)
-        self.console.print()
+        # Heading, table and spacing go out in a single console call
+        self.console.print(Group(
+            f"[bold]📁 Files with Issues ({len(files_with_issues)})[/bold]",
+            "",
+            table,
+            ""
+        ))
     
     def _handle_export_results(self, result: ReviewResult) -> None:
         """Handle exporting results to file"""
@@ -399,8 +416,8 @@ class InteractiveUI:
         Returns:
             True to continue with push, False to abort
         """
-        if not self.interactive_mode:
-            # Non-interactive mode: auto-decide based on errors
+        if not self.interactive_mode or not self._stdin_is_tty:
+            # Non-interactive mode (or nobody to answer prompts): auto-decide based on errors
             return result.total_errors == 0
         
         # Interactive mode: ask user
@@ -0,0 +1,8 @@
+"""
+Python version compatibility helpers for AI Code Review
+"""
+
+import sys
+
+# Keyword arguments that enable __slots__ on dataclasses where supported (3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
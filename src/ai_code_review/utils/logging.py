@@ -2,17 +2,40 @@
 Logging utilities for AI Code Review
 """
 
+import functools
 import logging
 import logging.handlers
 import os
+import re
 import sys
+import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 from colorama import init, Fore, Back, Style
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+
+@functools.lru_cache(maxsize=None)
+def is_stdout_tty() -> bool:
+    """Check once per process whether stdout is a terminal"""
+    return sys.stdout.isatty()
+
+
+# Colorama translates ANSI codes for the Windows console and strips them when
+# stdout is redirected; a POSIX terminal needs neither, so skip its stdout proxy
+if sys.platform == 'win32' or not is_stdout_tty():
+    init(autoreset=True)
+
+# File size strings like '10MB' or '1.5 GB' (already upper-cased)
+_FILE_SIZE_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*([KMGT]?B?)$')
+
+_FILE_SIZE_MULTIPLIERS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024 ** 2,
+    'GB': 1024 ** 3,
+    'TB': 1024 ** 4,
+}
 
 
 class ColoredFormatter(logging.Formatter):
@@ -26,12 +49,45 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Fore.RED + Back.WHITE + Style.BRIGHT,
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored_levelnames = {
+            levelname: f"{color}{levelname}{Style.RESET_ALL}"
+            for levelname, color in self.COLORS.items()
+        }
+    
     def format(self, record):
-        # Add color to the level name
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{Style.RESET_ALL}"
+        colored_levelname = self._colored_levelnames.get(record.levelname)
+        if colored_levelname is None:
+            return super().format(record)
         
-        return super().format(record)
+        # Add color to the level name for this handler only; the record is
+        # shared with other handlers such as the plain log file
+        levelname = record.levelname
+        record.levelname = colored_levelname
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that only flushes immediately for warnings and above"""
+    
+    _defer_flush = False
+    
+    def emit(self, record):
+        # Records below WARNING stay in the file buffer until a later flush,
+        # rollover or close (logging flushes all handlers at exit)
+        self._defer_flush = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+    
+    def flush(self):
+        if not self._defer_flush:
+            super().flush()
 
 
 def setup_logging(config: Optional[Dict[str, Any]] = None) -> logging.Logger:
@@ -66,7 +122,7 @@ def setup_logging(config: Optional[Dict[str, Any]] = None) -> logging.Logger:
     console_handler.setLevel(getattr(logging, log_level, logging.INFO))
     
     # Use colored formatter for console
-    if sys.stdout.isatty():  # Only use colors if output is a terminal
+    if is_stdout_tty():  # Only use colors if output is a terminal
         console_formatter = ColoredFormatter(log_format)
     else:
         console_formatter = logging.Formatter(log_format)
@@ -84,12 +140,13 @@ def setup_logging(config: Optional[Dict[str, Any]] = None) -> logging.Logger:
             # Parse max file size
             max_bytes = parse_file_size(max_file_size)
             
-            # Create rotating file handler
-            file_handler = logging.handlers.RotatingFileHandler(
+            # Create rotating file handler; the file is only opened once a record is logged
+            file_handler = BufferedRotatingFileHandler(
                 log_file,
                 maxBytes=max_bytes,
                 backupCount=backup_count,
-                encoding='utf-8'
+                encoding='utf-8',
+                delay=True
             )
             file_handler.setLevel(getattr(logging, log_level, logging.INFO))
             
@@ -136,8 +193,7 @@ def parse_file_size(size_str: str) -> int:
     size_str = size_str.upper().strip()
     
     # Extract number and unit
-    import re
-    match = re.match(r'^(\d+(?:\.\d+)?)\s*([KMGT]?B?)$', size_str)
+    match = _FILE_SIZE_RE.match(size_str)
     if not match:
         raise ValueError(f"Invalid file size format: {size_str}")
     
@@ -145,54 +201,64 @@ def parse_file_size(size_str: str) -> int:
     unit = match.group(2) or 'B'
     
     # Convert to bytes
-    multipliers = {
-        'B': 1,
-        'KB': 1024,
-        'MB': 1024 ** 2,
-        'GB': 1024 ** 3,
-        'TB': 1024 ** 4,
-    }
-    
-    if unit not in multipliers:
+    if unit not in _FILE_SIZE_MULTIPLIERS:
         raise ValueError(f"Unknown size unit: {unit}")
     
-    return int(number * multipliers[unit])
+    return int(number * _FILE_SIZE_MULTIPLIERS[unit])
 
 
 def log_function_call(func):
-    """Decorator to log function calls"""
+    """
+    Decorator to log function calls
+    
+    The logger is resolved once at decoration time and the call arguments
+    are only formatted when debug logging is enabled.
+    """
+    logger = get_logger(func.__module__)
+    
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
         
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func.__name__} completed successfully")
-            return result
         except Exception as e:
             logger.error(f"{func.__name__} failed with error: {e}")
             raise
+        
+        if debug_enabled:
+            logger.debug(f"{func.__name__} completed successfully")
+        return result
     
     return wrapper
 
 
 def log_performance(func):
-    """Decorator to log function performance"""
+    """
+    Decorator to log function performance
+    
+    The logger is resolved once at decoration time and the timing message is
+    only formatted when debug logging is enabled.
+    """
+    logger = get_logger(func.__module__)
+    
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        import time
-        
-        logger = get_logger(func.__module__)
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             result = func(*args, **kwargs)
-            elapsed = time.time() - start_time
-            logger.debug(f"{func.__name__} completed in {elapsed:.3f}s")
-            return result
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.error(f"{func.__name__} failed after {elapsed:.3f}s: {e}")
             raise
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - start_time
+            logger.debug(f"{func.__name__} completed in {elapsed:.3f}s")
+        return result
     
     return wrapper
 